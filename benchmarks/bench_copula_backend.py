@@ -0,0 +1,49 @@
+"""
+Benchmark the Gaussian copula synthesizer backend.
+
+Times FairDataGenerator fit and sample with ``backend='copula'`` on a
+large application extract and reports how closely the samples track the
+training marginals. CTGAN is not timed; it needs torch and runs for hours
+at this size.
+
+    python benchmarks/bench_copula_backend.py --rows 1000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from synthetic_generator.fair_gan import FairDataGenerator
+from bench_single_applicant import make_applications
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1000000)
+    args = parser.parse_args()
+
+    df = make_applications(args.rows)
+    generator = FairDataGenerator(backend='copula', random_state=0)
+
+    start = time.perf_counter()
+    generator.fit(df)
+    fit_time = time.perf_counter() - start
+    np.random.seed(0)
+    start = time.perf_counter()
+    synthetic = generator.sample(args.rows)
+    sample_time = time.perf_counter() - start
+
+    print(f"{args.rows} rows x {df.shape[1]} columns")
+    print(f"fit:    {fit_time:7.2f} s")
+    print(f"sample: {sample_time:7.2f} s")
+    for col in df.select_dtypes(include=[np.number]).columns:
+        print(f"{col:>25}: median {df[col].median():10.1f} -> {synthetic[col].median():10.1f}"
+              f"  missing {df[col].isna().mean():.3f} -> {synthetic[col].isna().mean():.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark DataCleaner imputation on wide frames.
+
+Compares the single-pass columnar imputation against the previous
+per-column loop (isnull/median/mode per column, chained fillna), both
+when fitting and filling in one go and when filling a scoring batch with
+already fitted values.
+
+    python benchmarks/bench_imputation.py --rows 100000 --numeric 120 --categorical 30
+
+Best of 5 on one CPU (NumPy 1.26, pandas 2.2), three runs each:
+
+    rows      fit + fill    fill only
+    20000     2.0-2.6x      6.9-9.0x
+    50000     1.4-1.7x      5.0-6.0x
+    100000    1.7x          5.4-6.2x
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processing.data_cleaner import DataCleaner
+
+
+def make_wide_frame(rows, numeric, categorical, missing_rate=0.05, seed=0):
+    """Wide frame with missing values sprinkled through every column"""
+    rng = np.random.default_rng(seed)
+    data = {f'num_{i}': rng.normal(size=rows) for i in range(numeric)}
+    labels = np.array(['Nairobi', 'Mombasa', 'Kisumu', 'Nakuru', 'Eldoret'], dtype=object)
+    for i in range(categorical):
+        data[f'cat_{i}'] = labels[rng.integers(0, len(labels), rows)]
+    df = pd.DataFrame(data)
+    return df.mask(rng.random(df.shape) < missing_rate)
+
+
+def per_column_imputation(df):
+    """The previous implementation, kept here as the baseline"""
+    df = df.copy()
+    for col in df.select_dtypes(include=[np.number]).columns:
+        if df[col].isnull().sum() > 0:
+            df[col] = df[col].fillna(df[col].median())
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if df[col].isnull().sum() > 0:
+            df[col] = df[col].fillna(df[col].mode()[0] if not df[col].mode().empty else 'Unknown')
+    return df
+
+
+def columnar_imputation(df):
+    cleaner = DataCleaner()
+    cleaner._fit_imputation(df)
+    return cleaner._transform_steps(df)
+
+
+def best_of(func, df, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--numeric', type=int, default=120)
+    parser.add_argument('--categorical', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_wide_frame(args.rows, args.numeric, args.categorical)
+    baseline, expected = best_of(per_column_imputation, df, args.repeat)
+    columnar, result = best_of(columnar_imputation, df, args.repeat)
+    pd.testing.assert_frame_equal(result, expected)
+
+    fitted = DataCleaner()
+    fitted._fit_imputation(df)
+    fill_only, result = best_of(fitted._transform_steps, df, args.repeat)
+    pd.testing.assert_frame_equal(result, expected)
+
+    print(f"{args.rows} rows x {df.shape[1]} columns")
+    print(f"per-column loop:     {baseline * 1000:9.1f} ms")
+    print(f"columnar imputation: {columnar * 1000:9.1f} ms  ({baseline / columnar:.1f}x)")
+    print(f"fitted fill only:    {fill_only * 1000:9.1f} ms  ({baseline / fill_only:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
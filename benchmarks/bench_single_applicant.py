@@ -0,0 +1,74 @@
+"""
+Benchmark single-applicant cleaning latency for online scoring.
+
+Compares DataCleaner.transform_record (dict in, array out) against
+cleaning a one-row DataFrame with the fitted batch transform, reporting
+p50/p99 latency per request.
+
+    python benchmarks/bench_single_applicant.py --requests 20000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processing.data_cleaner import DataCleaner
+
+
+def make_applications(rows, seed=0):
+    """Credit applications shaped like the training extracts"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'age': rng.integers(18, 70, rows).astype(float),
+        'location': rng.choice(['Nairobi', 'Mombasa', 'Kisumu', 'Nakuru', 'Eldoret'], rows),
+        'gender': rng.choice(['Male', 'Female'], rows),
+        'education_level': rng.choice(['Primary', 'Secondary', 'Tertiary'], rows),
+        'business_type': rng.choice(['Retail', 'Agriculture', 'Transport', 'Services'], rows),
+        'sacco_member': rng.integers(0, 2, rows),
+        'mpesa_transaction_count': rng.poisson(40, rows).astype(float),
+        'loan_amount': rng.uniform(1000, 100000, rows),
+        'income': rng.uniform(5000, 80000, rows),
+    })
+    return df.mask(rng.random(df.shape) < 0.05)
+
+
+def latencies(func, records):
+    timings = np.empty(len(records))
+    for i, record in enumerate(records):
+        start = time.perf_counter()
+        func(record)
+        timings[i] = time.perf_counter() - start
+    return timings * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=50000, help="Training rows used to fit the cleaner")
+    parser.add_argument('--requests', type=int, default=20000)
+    args = parser.parse_args()
+
+    cleaner = DataCleaner().fit(make_applications(args.rows))
+    records = make_applications(args.requests, seed=1).to_dict('records')
+
+    def batch_path(record):
+        return cleaner.to_feature_array(cleaner.transform(pd.DataFrame([record])))[0]
+
+    for record in records[:200]:
+        np.testing.assert_array_equal(cleaner.transform_record(record), batch_path(record))
+
+    batch = latencies(batch_path, records[:max(1, args.requests // 20)])
+    single = latencies(cleaner.transform_record, records)
+
+    print(f"{len(cleaner.feature_names)} features, {args.requests} requests")
+    print(f"one-row DataFrame:  p50 {np.percentile(batch, 50):9.1f} us  p99 {np.percentile(batch, 99):9.1f} us")
+    print(f"transform_record:   p50 {np.percentile(single, 50):9.1f} us  p99 {np.percentile(single, 99):9.1f} us"
+          f"  ({np.percentile(batch, 50) / np.percentile(single, 50):.0f}x at p50)")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,10 +2,22 @@ import streamlit as st
 import pandas as pd
 import matplotlib.pyplot as plt
 from src.data_processing.bias_detector import BiasDetector
+from src.data_processing.report_cache import ReportCache
 from src.synthetic_generator.fair_gan import FairDataGenerator
+from src.synthetic_generator.model_cache import ModelCache
 
 st.set_page_config(page_title="FairLend Kenya", page_icon="🇰🇪", layout="wide")
 
+@st.cache_resource
+def get_bias_detector():
+    """Detector shared across reruns so unchanged uploads reuse cached reports"""
+    return BiasDetector(cache=ReportCache())
+
+@st.cache_resource
+def get_model_cache():
+    """Trained synthesizers shared across reruns so repeat requests only sample"""
+    return ModelCache()
+
 st.title("🇰🇪 FairLend Kenya: Synthetic Data for Inclusive Credit")
 st.markdown("### Generating Fair AI Training Data for Credit Risk Assessment")
 
@@ -58,8 +70,8 @@ elif section == "Bias Detection":
         # Analyze bias
         if st.button("Analyze Bias in Dataset"):
             with st.spinner("Analyzing dataset for biases..."):
-                detector = BiasDetector()
-                bias_report = detector.analyze_dataset(uploaded_file)
+                detector = get_bias_detector()
+                bias_report = detector.analyze_dataset(data)
                 
                 # Display results
                 st.subheader("Bias Analysis Results")
@@ -87,9 +99,13 @@ elif section == "Synthetic Data Generation":
     
     st.info("Upload your data in the 'Bias Detection' section first, then generate synthetic data here.")
     
+    backend = st.radio("Synthesizer", ["copula", "ctgan"], horizontal=True,
+                       help="Gaussian copula fits in seconds; CTGAN captures more complex structure but trains slowly")
+    
     if st.button("Generate Sample Fair Data"):
         with st.spinner("Generating fair synthetic data using AI..."):
-            # Create sample data for demo
+            # Create sample data for demo (seeded so reruns hit the model cache)
+            np.random.seed(42)
             sample_data = pd.DataFrame({
                 'age': np.random.randint(20, 60, 1000),
                 'location': np.random.choice(['Nairobi', 'Mombasa', 'Kisumu', 'Rural'], 1000, p=[0.4, 0.3, 0.2, 0.1]),
@@ -100,7 +116,7 @@ elif section == "Synthetic Data Generation":
             })
             
             # Generate synthetic data
-            generator = FairDataGenerator()
+            generator = FairDataGenerator(cache=get_model_cache(), backend=backend)
             synthetic_data = generator.generate_fair_data(sample_data, num_samples=2000)
             
             st.success("✅ Synthetic data generated successfully!")
@@ -79,12 +79,8 @@
    "metadata": {},
    "outputs": [],
    "source": [
-    "# Save data temporarily for analysis\n",
-    "temp_path = '../data/temp_analysis.csv'\n",
-    "df.to_csv(temp_path, index=False)\n",
-    "\n",
     "# Run bias analysis\n",
-    "bias_report = detector.analyze_dataset(temp_path)\n",
+    "bias_report = detector.analyze_dataset(df)\n",
     "\n",
     "print(\"\\n\" + \"=\"*60)\n",
     "print(\"BIAS ANALYSIS REPORT\")\n",
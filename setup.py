@@ -32,6 +32,7 @@ setup(
     entry_points={
         "console_scripts": [
             "fairlend=demo.app:main",
+            "fairlend-audit=data_processing.batch_audit:main",
         ],
     },
 )
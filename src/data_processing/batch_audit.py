@@ -0,0 +1,115 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .bias_detector import BiasDetector
+from .bias_statistics import BiasStatistics
+
+
+def _audit_file(detector, path, chunksize):
+    """Worker entry point: sufficient statistics for one file"""
+    return detector.accumulate_statistics(path, chunksize=chunksize)
+
+
+class BatchAuditor:
+    """Audit many credit data extracts in parallel across a process pool.
+
+    Each worker reduces one file to ``BiasStatistics``; only those small
+    states travel back to the parent, which builds the per-file reports and
+    merges the states into a pooled report over all files.
+    """
+
+    def __init__(self, detector=None, max_workers=None, chunksize=None):
+        self.detector = detector if detector is not None else BiasDetector()
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunksize = chunksize  # Rows per chunk within each file (None reads whole files)
+
+    def iter_audits(self, paths):
+        """Yield ``(path, report, stats)`` as each file finishes.
+
+        Files that fail to load yield ``{'error': message}`` as the report and
+        ``None`` as the statistics.
+        """
+        paths = list(paths)
+        if self.max_workers == 1 or len(paths) <= 1:
+            for path in paths:
+                yield self._finish(path, lambda: _audit_file(self.detector, path, self.chunksize))
+            return
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(paths))) as executor:
+            futures = {
+                executor.submit(_audit_file, self.detector, path, self.chunksize): path
+                for path in paths
+            }
+            for future in as_completed(futures):
+                yield self._finish(futures[future], future.result)
+
+    def audit_files(self, paths, on_result=None):
+        """Audit every file and return per-file reports plus a pooled report.
+
+        ``on_result`` is called with ``(path, report)`` as soon as each file
+        completes, so progress can be streamed while the pool is busy.
+        """
+        paths = list(paths)
+        reports, states = {}, {}
+        for path, report, stats in self.iter_audits(paths):
+            reports[path] = report
+            if stats is not None:
+                states[path] = stats
+            if on_result is not None:
+                on_result(path, report)
+
+        # Merge in input order so the pooled report does not depend on scheduling
+        pooled = BiasStatistics.merge_all(states[path] for path in paths if path in states)
+        return {
+            'files': {path: reports[path] for path in paths},
+            'pooled': self.detector.report_from_statistics(pooled)
+        }
+
+    def _finish(self, path, get_stats):
+        """Turn a worker result into ``(path, report, stats)``"""
+        try:
+            stats = get_stats()
+        except Exception as exc:  # One unreadable extract should not sink the batch
+            return path, {'error': f"{type(exc).__name__}: {exc}"}, None
+        return path, self.detector.report_from_statistics(stats), stats
+
+
+def _summarize(report):
+    """One-line summary of a report for progress output"""
+    if 'error' in report:
+        return f"ERROR {report['error']}"
+    ratios = [
+        f"{attr}={metrics['disparate_impact']:.3f}{'*' if metrics['is_biased'] else ''}"
+        for attr, metrics in report['bias_metrics'].items() if isinstance(metrics, dict)
+    ]
+    return f"{report['dataset_shape'][0]} rows, DI " + ', '.join(ratios)
+
+
+def main(argv=None):
+    """Command-line batch audit: ``python -m data_processing.batch_audit FILE [FILE ...]``"""
+    parser = argparse.ArgumentParser(description="Audit credit data extracts for disparate impact in parallel")
+    parser.add_argument('paths', nargs='+', help="CSV, Parquet or Arrow IPC files to audit")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--chunksize', type=int, default=None, help="Rows per chunk when streaming each file")
+    parser.add_argument('--threshold', type=float, default=0.8, help="Disparate impact threshold")
+    parser.add_argument('--output', help="Write per-file and pooled reports to this JSON file")
+    args = parser.parse_args(argv)
+
+    auditor = BatchAuditor(BiasDetector(di_threshold=args.threshold), args.workers, args.chunksize)
+    results = auditor.audit_files(
+        args.paths, on_result=lambda path, report: print(f"{path}: {_summarize(report)}", flush=True)
+    )
+    print(f"POOLED: {_summarize(results['pooled'])}")
+
+    if args.output:
+        with open(args.output, 'w') as fh:
+            json.dump(results, fh, indent=2, default=str)
+
+    return 1 if any('error' in report for report in results['files'].values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
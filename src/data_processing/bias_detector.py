@@ -1,62 +1,404 @@
+import hashlib
+import itertools
 import pandas as pd
 import numpy as np
-from aif360.datasets import BinaryLabelDataset
-from aif360.metrics import BinaryLabelDatasetMetric
-from aif360.algorithms.preprocessing import Reweighing
-import matplotlib.pyplot as plt
-import seaborn as sns
+
+from .bias_statistics import BiasStatistics
+from .chunked_source import ChunkedSource
 
 class BiasDetector:
-    def __init__(self):
+    def __init__(self, di_threshold=0.8, n_bootstrap=0, confidence_level=0.95, random_state=None,
+                 cache=None):
         self.protected_attributes = ['location', 'gender', 'business_type']
+        self.target_column = 'loan_approved'
+        self.di_threshold = di_threshold  # Common "four-fifths" threshold
+        # Bootstrap replicates for disparate impact intervals (0 disables them)
+        self.n_bootstrap = n_bootstrap
+        self.confidence_level = confidence_level
+        self.rng = np.random.default_rng(random_state)
+        self.cache = cache  # Optional ReportCache shared across audits
+        
+    def analyze_dataset(self, data, chunksize=None):
+        """Comprehensive bias analysis of credit dataset.
+        
+        ``data`` may be a DataFrame, a NumPy record array, or a path (or file
+        object) to a CSV, Parquet or Arrow IPC file. Files are read with only
+        the protected attributes and target column projected; pass
+        ``chunksize`` to stream them in bounded memory.
+        """
+        return self._cached_report(
+            'analyze_dataset', data, self._audit_columns(), (),
+            lambda: self.report_from_statistics(self.accumulate_statistics(data, chunksize))
+        )
+    
+    def accumulate_statistics(self, data, chunksize=None):
+        """Per-group sufficient statistics for ``data``.
         
-    def analyze_dataset(self, data_path):
-        """Comprehensive bias analysis of credit dataset"""
-        df = pd.read_csv(data_path)
+        With ``chunksize`` set, files are read ``chunksize`` rows at a time and
+        the partial statistics merged, so memory stays bounded by the chunk.
+        The returned ``BiasStatistics`` can be merged with those of other files
+        or shards before building a report.
+        """
+        if chunksize is None or isinstance(data, (pd.DataFrame, np.ndarray)):
+            df, dataset_shape = self._load_audit_columns(data)
+            return self._statistics_from_frame(df, dataset_shape[1])
         
+        return BiasStatistics.merge_all(
+            self._statistics_from_frame(chunk, n_columns)
+            for chunk, n_columns in self._iter_audit_chunks(data, chunksize)
+        )
+    
+    def report_from_statistics(self, stats):
+        """Build the bias report from (possibly merged) sufficient statistics"""
         # Basic statistics
         report = {
-            'dataset_shape': df.shape,
-            'approval_rate': df['loan_approved'].mean() if 'loan_approved' in df.columns else None,
+            'dataset_shape': (stats.n_rows, stats.n_columns),
+            'approval_rate': stats.approval_rate,
             'bias_metrics': {}
         }
         
         # Check for disparate impact across protected attributes
         for attr in self.protected_attributes:
-            if attr in df.columns:
-                bias_metric = self._calculate_disparate_impact(df, attr)
-                report['bias_metrics'][attr] = bias_metric
+            if attr not in stats.groups:
+                continue
+            if not stats.has_target:
+                report['bias_metrics'][attr] = f"Target column '{self.target_column}' not found"
+                continue
+            labels, counts, approvals = stats.groups[attr]
+            report['bias_metrics'][attr] = self._disparate_impact_from_counts(
+                attr, labels, counts, approvals
+            )
                 
         return report
     
+    def _statistics_from_frame(self, df, n_columns):
+        """Sufficient statistics of an in-memory frame"""
+        attributes = [attr for attr in self.protected_attributes if attr in df.columns]
+        if self.target_column not in df.columns:
+            empty = (np.empty(0, dtype=object), np.zeros(0, dtype=np.int64), np.zeros(0))
+            return BiasStatistics(n_rows=len(df), n_columns=n_columns, has_target=False,
+                                  groups={attr: empty for attr in attributes})
+        
+        target = df[self.target_column]
+        return BiasStatistics(
+            n_rows=len(df),
+            n_columns=n_columns,
+            n_labelled=int(target.count()),
+            n_approved=float(target.sum()),
+            groups=self._group_statistics(df, attributes)
+        )
+    
+    def _cached_report(self, method, data, columns, params, compute):
+        """Return a cached report when the data and settings are unchanged"""
+        if self.cache is None:
+            return compute()
+        
+        fingerprint = self.cache.fingerprint(data, columns)
+        if fingerprint is None:
+            return compute()
+        
+        settings = (method, tuple(columns), params, self.di_threshold,
+                    self.n_bootstrap, self.confidence_level)
+        key = hashlib.blake2b(f"{fingerprint}:{settings!r}".encode(), digest_size=16).hexdigest()
+        report = self.cache.get(key)
+        if report is None:
+            report = compute()
+            self.cache.put(key, report)
+        return report
+    
+    def _audit_columns(self):
+        """Columns needed for an audit"""
+        return self.protected_attributes + [self.target_column]
+    
+    def _load_audit_columns(self, data, columns=None):
+        """Load only the audit columns from ``data`` along with its full shape"""
+        if columns is None:
+            columns = self._audit_columns()
+        
+        if isinstance(data, pd.DataFrame):
+            return data, data.shape
+        
+        if isinstance(data, np.ndarray):
+            if data.dtype.names is None:
+                raise ValueError("NumPy input must be a structured or record array with named fields")
+            df = pd.DataFrame({name: data[name] for name in columns if name in data.dtype.names})
+            return df, (len(data), len(data.dtype.names))
+        
+        source = self._audit_source(data, columns)
+        df = source.read()
+        return df, (len(df), source.n_columns)
+    
+    def _iter_audit_chunks(self, data, chunksize):
+        """Yield ``(chunk, n_columns)`` pairs of audit columns read from a file"""
+        source = self._audit_source(data, self._audit_columns())
+        for chunk in source.chunks(chunksize):
+            yield chunk, source.n_columns
+    
+    def _audit_source(self, data, columns):
+        """File source projected to ``columns``, storing string protected attributes as categories"""
+        return ChunkedSource(data, columns, categorical=[col for col in columns if col != self.target_column])
+    
+    def analyze_intersections(self, data, attributes=None, max_order=3, min_support=30):
+        """Disparate impact across intersections of protected attributes.
+        
+        Every combination of up to ``max_order`` attributes is audited, e.g.
+        location x gender x business_type. Subgroups with fewer than
+        ``min_support`` applications are dropped, and because a subgroup can
+        never be larger than any of its parents, only rows that fall in a
+        supported (k-1)-way subgroup are counted at order k (Apriori pruning).
+        Intersections start at pairs, so ``max_order`` must be at least 2.
+        """
+        if max_order < 2:
+            raise ValueError("max_order must be at least 2; use analyze_dataset for single attributes")
+        if attributes is None:
+            attributes = self.protected_attributes
+        return self._cached_report(
+            'analyze_intersections', data, list(attributes) + [self.target_column],
+            (max_order, min_support),
+            lambda: self._analyze_intersections(data, attributes, max_order, min_support)
+        )
+    
+    def _analyze_intersections(self, data, attributes, max_order, min_support):
+        """Uncached body of ``analyze_intersections``"""
+        df, _ = self._load_audit_columns(data, list(attributes) + [self.target_column])
+        attributes = [attr for attr in attributes if attr in df.columns]
+        
+        report = {'max_order': max_order, 'min_support': min_support, 'intersections': {}}
+        if self.target_column not in df.columns:
+            report['intersections'] = f"Target column '{self.target_column}' not found"
+            return report
+        
+        # Encode every attribute once; rows with a missing target are excluded
+        approved = df[self.target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        labelled = ~np.isnan(approved)
+        approved = approved[labelled]
+        codes, labels = {}, {}
+        for attr in attributes:
+            attr_codes, labels[attr] = self._factorize(df[attr])
+            codes[attr] = attr_codes[labelled].astype(np.int64)
+        
+        # Level 1 seeds: supported values of each attribute
+        frontier = {}
+        for attr in attributes:
+            valid = codes[attr] >= 0
+            counts = np.bincount(codes[attr][valid], minlength=len(labels[attr]))
+            rows = np.flatnonzero(valid & (counts[np.maximum(codes[attr], 0)] >= min_support))
+            if len(rows):
+                frontier[(attr,)] = (rows, codes[attr][rows], len(labels[attr]))
+        
+        for order in range(2, max_order + 1):
+            next_frontier = {}
+            for combo, (rows, combo_codes, n_cells) in frontier.items():
+                last = attributes.index(combo[-1])
+                for attr in attributes[last + 1:]:
+                    extended = combo + (attr,)
+                    # Skip combinations with an unsupported (k-1)-way parent
+                    if any(parent not in frontier for parent in itertools.combinations(extended, order - 1)):
+                        continue
+                    
+                    attr_codes = codes[attr][rows]
+                    valid = attr_codes >= 0
+                    extended_cells = n_cells * len(labels[attr])
+                    cell_codes = combo_codes[valid] * len(labels[attr]) + attr_codes[valid]
+                    _, inverse, counts = self._cell_counts(cell_codes, extended_cells)
+                    supported = counts[inverse] >= min_support
+                    if supported.any():
+                        next_frontier[extended] = (rows[valid][supported], cell_codes[supported], extended_cells)
+            
+            for combo, (rows, combo_codes, n_cells) in next_frontier.items():
+                report['intersections'][combo] = self._intersection_metrics(
+                    combo, combo_codes, n_cells, approved[rows], labels, min_support
+                )
+            frontier = next_frontier
+        
+        return report
+    
+    @staticmethod
+    def _cell_counts(cell_codes, n_cells):
+        """Occupied cells, each row's index into them, and their counts.
+        
+        Dense cell spaces are counted with ``np.bincount``; sparse ones (many
+        high-order combinations of large attributes) fall back to sorting.
+        """
+        if n_cells <= max(4 * len(cell_codes), 1 << 16):
+            dense_counts = np.bincount(cell_codes, minlength=n_cells)
+            cells = np.flatnonzero(dense_counts)
+            lookup = np.zeros(n_cells, dtype=np.intp)
+            lookup[cells] = np.arange(len(cells))
+            return cells, lookup[cell_codes], dense_counts[cells]
+        return np.unique(cell_codes, return_inverse=True, return_counts=True)
+    
+    def _intersection_metrics(self, combo, cell_codes, n_cells, approved, labels, min_support):
+        """Disparate impact metrics for the supported subgroups of one combination"""
+        cells, inverse, counts = self._cell_counts(cell_codes, n_cells)
+        approvals = np.bincount(inverse, weights=approved, minlength=len(cells))
+        
+        # Decode the mixed-radix cell codes back into one label per attribute
+        components = []
+        remainder = cells
+        for attr in reversed(combo):
+            components.append(labels[attr][remainder % len(labels[attr])])
+            remainder = remainder // len(labels[attr])
+        cell_labels = np.empty(len(cells), dtype=object)
+        for i, cell_label in enumerate(zip(*reversed(components))):
+            cell_labels[i] = cell_label
+        
+        metrics = self._disparate_impact_from_counts(
+            ' x '.join(combo), cell_labels, counts, approvals
+        )
+        if isinstance(metrics, dict):
+            metrics['group_sizes'] = dict(zip(cell_labels.tolist(), counts.tolist()))
+        else:
+            metrics = f"Not enough subgroups with at least {min_support} applications in {' x '.join(combo)}"
+        return metrics
+    
+    def reweighing_weights(self, data, attributes=None):
+        """Per-row Reweighing sample weights (Kamiran & Calders).
+        
+        Each (group, label) cell gets weight ``P(group) * P(label) / P(group, label)``
+        where the group is the joint combination of ``attributes``. Weights
+        come from the contingency counts with a single gather back to rows,
+        so no aif360 ``BinaryLabelDataset`` is built. Attributes may be labels
+        or integer group codes; rows with a missing group or label get weight
+        1. Returns a float32 array suitable for sklearn ``sample_weight``.
+        """
+        if attributes is None:
+            attributes = self.protected_attributes
+        df, _ = self._load_audit_columns(data, list(attributes) + [self.target_column])
+        attributes = [attr for attr in attributes if attr in df.columns]
+        if self.target_column not in df.columns:
+            raise ValueError(f"Target column '{self.target_column}' not found")
+        
+        # Joint group code across attributes, then one cell per (group, label)
+        group_codes = np.zeros(len(df), dtype=np.int64)
+        n_groups = 1
+        valid = np.ones(len(df), dtype=bool)
+        for attr in attributes:
+            codes, labels = self._factorize(df[attr])
+            valid &= codes >= 0
+            group_codes = group_codes * len(labels) + codes
+            n_groups *= len(labels)
+        label_codes, labels = self._factorize(df[self.target_column])
+        valid &= label_codes >= 0
+        n_labels = len(labels)
+        
+        weights = np.ones(len(df), dtype=np.float32)
+        cell_codes = group_codes[valid] * n_labels + label_codes[valid]
+        cells, inverse, cell_counts = self._cell_counts(cell_codes, n_groups * n_labels)
+        
+        # Group and label marginals from the (small) table of occupied cells
+        cell_labels = cells % n_labels
+        _, cell_groups = np.unique(cells // n_labels, return_inverse=True)
+        group_totals = np.bincount(cell_groups, weights=cell_counts)
+        label_totals = np.bincount(cell_labels, weights=cell_counts, minlength=n_labels)
+        
+        cell_weights = (group_totals[cell_groups] * label_totals[cell_labels]
+                        / (len(cell_codes) * cell_counts))
+        weights[valid] = cell_weights[inverse]
+        return weights
+    
     def _calculate_disparate_impact(self, df, protected_attribute):
         """Calculate disparate impact ratio"""
-        if 'loan_approved' not in df.columns:
-            return "Target column 'loan_approved' not found"
-            
-        unique_values = df[protected_attribute].unique()
-        if len(unique_values) < 2:
+        if self.target_column not in df.columns:
+            return f"Target column '{self.target_column}' not found"
+        
+        labels, counts, approvals = self._group_statistics(df, [protected_attribute])[protected_attribute]
+        return self._disparate_impact_from_counts(protected_attribute, labels, counts, approvals)
+    
+    def _group_statistics(self, df, attributes):
+        """Count rows and approvals per group for each attribute.
+        
+        Each attribute is factorized to integer codes once and reduced with
+        ``np.bincount``, so the cost is one scan per column rather than one
+        boolean mask and filtered copy per group value.
+        """
+        approved = df[self.target_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        missing_target = np.isnan(approved)
+        if not missing_target.any():
+            missing_target = None
+        else:
+            approved = np.where(missing_target, 0.0, approved)
+        
+        group_stats = {}
+        for attr in attributes:
+            codes, labels = self._factorize(df[attr])
+            # Shift codes by one so missing values (-1) land in a discarded bin
+            shifted = codes.astype(np.intp) + 1
+            if missing_target is not None:
+                shifted[missing_target] = 0
+            counts = np.bincount(shifted, minlength=len(labels) + 1)[1:]
+            approvals = np.bincount(shifted, weights=approved, minlength=len(labels) + 1)[1:]
+            group_stats[attr] = (labels, counts, approvals)
+        
+        return group_stats
+    
+    @staticmethod
+    def _factorize(series):
+        """Integer group codes and their labels, reusing categorical codes when present"""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            return series.cat.codes.to_numpy(), np.asarray(series.cat.categories, dtype=object)
+        codes, uniques = pd.factorize(series)
+        return codes, np.asarray(uniques, dtype=object)
+    
+    def _disparate_impact_from_counts(self, protected_attribute, labels, counts, approvals):
+        """Disparate impact metrics from per-group row and approval counts"""
+        metrics = self._disparate_impact_point(protected_attribute, labels, counts, approvals)
+        
+        if self.n_bootstrap and isinstance(metrics, dict):
+            present = counts > 0
+            lower, upper = self.disparate_impact_interval(counts[present], approvals[present])
+            metrics['disparate_impact_ci'] = (lower, upper)
+            # Biased even at the optimistic end of the interval
+            metrics['is_biased_confident'] = upper < self.di_threshold
+        
+        return metrics
+    
+    def _disparate_impact_point(self, protected_attribute, labels, counts, approvals):
+        """Disparate impact metrics from per-group counts, without a bootstrap interval"""
+        present = counts > 0
+        if present.sum() < 2:
             return f"Not enough unique values in {protected_attribute}"
-            
+        
         # Calculate approval rates for each group
-        approval_rates = {}
-        for value in unique_values:
-            group_data = df[df[protected_attribute] == value]
-            approval_rates[value] = group_data['loan_approved'].mean()
+        rates = approvals[present] / counts[present]
+        approval_rates = dict(zip(labels[present].tolist(), rates.tolist()))
             
         # Calculate disparate impact ratio
-        min_rate = min(approval_rates.values())
-        max_rate = max(approval_rates.values())
-        disparate_impact = min_rate / max_rate if max_rate > 0 else 0
+        min_rate = rates.min()
+        max_rate = rates.max()
+        disparate_impact = float(min_rate / max_rate) if max_rate > 0 else 0
         
         return {
             'approval_rates': approval_rates,
             'disparate_impact': disparate_impact,
-            'is_biased': disparate_impact < 0.8  # Common threshold
+            'is_biased': disparate_impact < self.di_threshold
         }
     
+    def disparate_impact_interval(self, counts, approvals, n_bootstrap=None, confidence_level=None):
+        """Percentile bootstrap interval for the disparate impact ratio.
+        
+        Resamples approvals per group as Binomial(count, observed rate) from
+        the group counts alone, so the cost depends on the number of groups
+        and replicates, never on the number of rows.
+        """
+        n_bootstrap = n_bootstrap or self.n_bootstrap or 10000
+        confidence_level = confidence_level or self.confidence_level
+        counts = np.asarray(counts, dtype=np.int64)
+        rates = np.asarray(approvals, dtype=np.float64) / counts
+        
+        resampled = self.rng.binomial(counts, rates, size=(n_bootstrap, len(counts))) / counts
+        max_rates = resampled.max(axis=1)
+        ratios = np.divide(resampled.min(axis=1), max_rates,
+                           out=np.zeros(n_bootstrap), where=max_rates > 0)
+        
+        tail = (1 - confidence_level) / 2 * 100
+        lower, upper = np.percentile(ratios, [tail, 100 - tail])
+        return float(lower), float(upper)
+    
     def generate_bias_report(self, report, save_path=None):
         """Generate visual bias report"""
+        import matplotlib.pyplot as plt  # Plotting stack is only loaded for reports
+        
         fig, axes = plt.subplots(1, len(report['bias_metrics']), figsize=(15, 5))
         
         for i, (attr, metrics) in enumerate(report['bias_metrics'].items()):
@@ -0,0 +1,172 @@
+import time
+
+import numpy as np
+
+from .bias_detector import BiasDetector
+
+
+class BiasMonitor:
+    """Sliding-window disparate impact monitor for live loan decisions.
+
+    Decisions are held in a ring buffer covering either the last
+    ``window_size`` events or the ``window_seconds`` seconds up to the latest
+    event's timestamp. Per-group counts are incremented when an event enters
+    the window and decremented when it leaves, so each event costs O(1)
+    regardless of window length.
+    Metrics follow ``BiasDetector`` definitions but skip its bootstrap
+    intervals, which would resample on every event. An alert is raised
+    when an attribute's windowed disparate impact drops below the
+    detector's threshold.
+    """
+
+    def __init__(self, detector=None, window_size=None, window_seconds=None,
+                 min_group_size=30, on_alert=None):
+        if (window_size is None) == (window_seconds is None):
+            raise ValueError("Specify exactly one of window_size or window_seconds")
+
+        self.detector = detector if detector is not None else BiasDetector()
+        self.attributes = list(self.detector.protected_attributes)
+        self.window_size = window_size
+        self.window_seconds = window_seconds
+        self.min_group_size = min_group_size  # Smaller groups are left out of the ratio
+        self.on_alert = on_alert
+        self.alerts = []
+
+        capacity = window_size if window_size is not None else 1024
+        self._codes = np.full((len(self.attributes), capacity), -1, dtype=np.int32)
+        self._approved = np.zeros(capacity, dtype=np.int8)
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._start = 0  # Index of the oldest event in the ring
+        self._size = 0
+
+        self._group_codes = [{} for _ in self.attributes]  # attr -> {label: code}
+        self._group_labels = [[] for _ in self.attributes]
+        self._counts = [np.zeros(8, dtype=np.int64) for _ in self.attributes]
+        self._approvals = [np.zeros(8, dtype=np.int64) for _ in self.attributes]
+        self._biased = [False] * len(self.attributes)
+
+    def __len__(self):
+        return self._size
+
+    def update(self, event, timestamp=None):
+        """Ingest one decision (a mapping with attribute values and the target) and check for bias"""
+        self._push(event, timestamp)
+        return self.check()
+
+    def update_batch(self, events, timestamps=None):
+        """Ingest a micro-batch of decisions (DataFrame or iterable of mappings) and check once"""
+        if hasattr(events, 'to_dict'):
+            events = events.to_dict('records')
+        if timestamps is None:
+            now = time.time()
+            for event in events:
+                self._push(event, now)
+        else:
+            for event, timestamp in zip(events, timestamps):
+                self._push(event, timestamp)
+        return self.check()
+
+    def current_metrics(self):
+        """Disparate impact metrics for every attribute over the current window"""
+        return {attr: self._window_metrics(i) for i, attr in enumerate(self.attributes)}
+
+    def check(self):
+        """Evaluate the window and return the alerts raised by this check"""
+        raised = []
+        for i, attr in enumerate(self.attributes):
+            metrics = self._window_metrics(i)
+            is_biased = isinstance(metrics, dict) and metrics['is_biased']
+            # Alert on the transition into a biased state rather than on every event
+            if is_biased and not self._biased[i]:
+                alert = {
+                    'attribute': attr,
+                    'disparate_impact': metrics['disparate_impact'],
+                    'approval_rates': metrics['approval_rates'],
+                    'window_events': self._size,
+                    'timestamp': float(self._timestamps[(self._start + self._size - 1) % len(self._approved)])
+                }
+                self.alerts.append(alert)
+                raised.append(alert)
+                if self.on_alert is not None:
+                    self.on_alert(alert)
+            self._biased[i] = is_biased
+        return raised
+
+    def _push(self, event, timestamp):
+        """Append one event to the ring, evicting whatever falls out of the window"""
+        timestamp = time.time() if timestamp is None else float(timestamp)
+        approved = int(event[self.detector.target_column])
+
+        if self.window_seconds is not None:
+            self._expire(timestamp)
+            if self._size == len(self._approved):
+                self._grow()
+        elif self._size == self.window_size:
+            self._evict_oldest()
+
+        slot = (self._start + self._size) % len(self._approved)
+        self._approved[slot] = approved
+        self._timestamps[slot] = timestamp
+        for i, attr in enumerate(self.attributes):
+            code = self._code_for(i, event.get(attr))
+            self._codes[i, slot] = code
+            if code >= 0:
+                self._counts[i][code] += 1
+                self._approvals[i][code] += approved
+        self._size += 1
+
+    def _expire(self, now):
+        """Evict events older than the time window"""
+        cutoff = now - self.window_seconds
+        while self._size and self._timestamps[self._start] <= cutoff:
+            self._evict_oldest()
+
+    def _evict_oldest(self):
+        """Remove the oldest event from the ring and its group counts"""
+        slot = self._start
+        approved = self._approved[slot]
+        for i in range(len(self.attributes)):
+            code = self._codes[i, slot]
+            if code >= 0:
+                self._counts[i][code] -= 1
+                self._approvals[i][code] -= approved
+        self._start = (self._start + 1) % len(self._approved)
+        self._size -= 1
+
+    def _grow(self):
+        """Double the ring capacity of a time-based window (amortized O(1))"""
+        order = (self._start + np.arange(self._size)) % len(self._approved)
+        capacity = 2 * len(self._approved)
+        codes = np.full((len(self.attributes), capacity), -1, dtype=np.int32)
+        codes[:, :self._size] = self._codes[:, order]
+        approved = np.zeros(capacity, dtype=np.int8)
+        approved[:self._size] = self._approved[order]
+        timestamps = np.zeros(capacity, dtype=np.float64)
+        timestamps[:self._size] = self._timestamps[order]
+        self._codes, self._approved, self._timestamps = codes, approved, timestamps
+        self._start = 0
+
+    def _code_for(self, i, label):
+        """Integer code of a group label, registering unseen labels"""
+        if label is None or label != label:  # Missing or NaN
+            return -1
+        codes = self._group_codes[i]
+        code = codes.get(label)
+        if code is None:
+            code = codes[label] = len(codes)
+            self._group_labels[i].append(label)
+            if code == len(self._counts[i]):
+                self._counts[i] = np.concatenate([self._counts[i], np.zeros_like(self._counts[i])])
+                self._approvals[i] = np.concatenate([self._approvals[i], np.zeros_like(self._approvals[i])])
+        return code
+
+    def _window_metrics(self, i):
+        """Disparate impact of one attribute over the window, ignoring small groups"""
+        n_groups = len(self._group_labels[i])
+        counts = self._counts[i][:n_groups].copy()
+        counts[counts < self.min_group_size] = 0
+        labels = np.empty(n_groups, dtype=object)
+        labels[:] = self._group_labels[i]
+        return self.detector._disparate_impact_point(
+            self.attributes[i], labels, counts, self._approvals[i][:n_groups]
+        )
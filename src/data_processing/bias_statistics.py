@@ -0,0 +1,61 @@
+import numpy as np
+import pandas as pd
+
+from .mergeable import MergeableState
+
+
+class BiasStatistics(MergeableState):
+    """Mergeable per-group sufficient statistics for a bias audit.
+
+    For every protected attribute the state holds the group labels with the
+    number of rows and approvals in each group. States built from separate
+    chunks, files or shards combine with ``merge`` and produce the same report
+    as a single pass over the concatenated data.
+    """
+
+    def __init__(self, n_rows=0, n_columns=0, n_labelled=0, n_approved=0.0,
+                 has_target=True, groups=None):
+        self.n_rows = n_rows
+        self.n_columns = n_columns
+        self.n_labelled = n_labelled  # Rows with a non-missing target
+        self.n_approved = n_approved
+        self.has_target = has_target
+        self.groups = groups if groups is not None else {}  # attr -> (labels, counts, approvals)
+
+    @property
+    def approval_rate(self):
+        """Overall approval rate, or None when the target column is absent"""
+        if not self.has_target:
+            return None
+        return self.n_approved / self.n_labelled if self.n_labelled else np.nan
+
+    def merge(self, other):
+        """Combine with another state, e.g. from the next chunk or another file"""
+        groups = {}
+        for attr in list(self.groups) + [a for a in other.groups if a not in self.groups]:
+            if attr not in other.groups:
+                groups[attr] = self.groups[attr]
+            elif attr not in self.groups:
+                groups[attr] = other.groups[attr]
+            else:
+                groups[attr] = self._merge_groups(self.groups[attr], other.groups[attr])
+
+        return BiasStatistics(
+            n_rows=self.n_rows + other.n_rows,
+            n_columns=max(self.n_columns, other.n_columns),
+            n_labelled=self.n_labelled + other.n_labelled,
+            n_approved=self.n_approved + other.n_approved,
+            has_target=self.has_target and other.has_target,
+            groups=groups
+        )
+
+    @staticmethod
+    def _merge_groups(left, right):
+        """Align two (labels, counts, approvals) triples on their labels and add them"""
+        labels = np.concatenate([left[0], right[0]])
+        codes, uniques = pd.factorize(labels)
+        counts = np.bincount(codes, weights=np.concatenate([left[1], right[1]]),
+                             minlength=len(uniques))
+        approvals = np.bincount(codes, weights=np.concatenate([left[2], right[2]]),
+                                minlength=len(uniques))
+        return np.asarray(uniques, dtype=object), counts.astype(np.int64), approvals
@@ -0,0 +1,160 @@
+import os
+
+import pandas as pd
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+
+
+class ChunkedSource:
+    """Tabular input read whole or in bounded chunks through one code path.
+
+    ``source`` may be a DataFrame, a path or file object for a CSV, Parquet
+    or Arrow IPC (Feather v2) file, or any other iterable of DataFrames.
+    Only the ``columns`` present are read (every column when None); string
+    columns named in ``categorical`` become pandas categories, dictionary
+    encoded in Arrow before conversion. ``read_csv_kwargs`` such as
+    ``dtype`` go to every ``pd.read_csv`` call. Once reading has started,
+    ``n_columns`` holds the full width of the source, ignoring projection
+    and stored pandas index columns.
+    """
+
+    def __init__(self, source, columns=None, categorical=(), **read_csv_kwargs):
+        self.source = source
+        self.columns = None if columns is None else list(columns)
+        self.categorical = set(categorical)
+        self.read_csv_kwargs = read_csv_kwargs
+        self.n_columns = None
+        self._header = []
+
+    @property
+    def format(self):
+        """'frame', 'parquet', 'arrow', 'csv' or 'frames' (an iterable of frames)"""
+        if isinstance(self.source, pd.DataFrame):
+            return 'frame'
+        if not isinstance(self.source, (str, os.PathLike)) and not hasattr(self.source, 'read'):
+            return 'frames'
+        extension = os.path.splitext(str(getattr(self.source, 'name', self.source)))[1].lower()
+        if extension in PARQUET_EXTENSIONS:
+            return 'parquet'
+        if extension in ARROW_EXTENSIONS:
+            return 'arrow'
+        return 'csv'
+
+    def read(self):
+        """The whole source as one frame"""
+        source_format = self.format
+        if source_format == 'frame':
+            self.n_columns = self.source.shape[1]
+            return self._from_frame(self.source)
+
+        if source_format == 'parquet':
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(self.source)
+            columns = self._arrow_columns(parquet_file.schema_arrow.names)
+            return self._from_arrow(parquet_file.read(columns=columns))
+
+        if source_format == 'arrow':
+            table = self._open_arrow().read_all()
+            columns = self._arrow_columns(table.column_names)
+            # Selecting from a memory-mapped table only touches the projected buffers
+            return self._from_arrow(table if columns is None else table.select(columns))
+
+        if source_format == 'csv':
+            df = pd.read_csv(self.source, **self._csv_options())
+            self.n_columns = len(dict.fromkeys(self._header))
+            return self._categorize(df)
+
+        return pd.concat(list(self.chunks(None)), ignore_index=True)
+
+    def chunks(self, chunksize):
+        """Yield the source ``chunksize`` rows at a time (frames from an iterable as they come)"""
+        source_format = self.format
+        if source_format == 'frame':
+            self.n_columns = self.source.shape[1]
+            df = self._from_frame(self.source)
+            for start in range(0, len(df), chunksize):
+                yield df.iloc[start:start + chunksize]
+
+        elif source_format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            parquet_file = pq.ParquetFile(self.source)
+            columns = self._arrow_columns(parquet_file.schema_arrow.names)
+            for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+                yield self._from_arrow(pa.Table.from_batches([batch]))
+
+        elif source_format == 'arrow':
+            import pyarrow as pa
+
+            reader = self._open_arrow()
+            columns = self._arrow_columns(reader.schema.names)
+            for i in range(reader.num_record_batches):
+                table = pa.Table.from_batches([reader.get_batch(i)])
+                if columns is not None:
+                    table = table.select(columns)
+                for offset in range(0, table.num_rows, chunksize):
+                    yield self._from_arrow(table.slice(offset, chunksize))
+
+        elif source_format == 'csv':
+            with pd.read_csv(self.source, chunksize=chunksize, **self._csv_options()) as reader:
+                for chunk in reader:
+                    self.n_columns = len(dict.fromkeys(self._header))
+                    yield self._categorize(chunk)
+
+        else:
+            for chunk in self.source:
+                self.n_columns = chunk.shape[1]
+                yield self._from_frame(chunk)
+
+    def _from_frame(self, df):
+        """Project an in-memory frame and store its categorical strings as categories"""
+        if self.columns is not None:
+            df = df[[col for col in self.columns if col in df.columns]]
+        return self._categorize(df)
+
+    def _categorize(self, df):
+        """Store string ``categorical`` columns as categories, leaving inferred numeric codes as they are"""
+        casts = {col: 'category' for col in df.columns if col in self.categorical and df[col].dtype == object}
+        return df.astype(casts) if casts else df
+
+    def _arrow_columns(self, names):
+        """Record the source width and return the projected columns, or None for all"""
+        names = [name for name in names if not name.startswith('__index_level_')]
+        self.n_columns = len(names)
+        if self.columns is None:
+            return None
+        return [col for col in self.columns if col in names]
+
+    def _from_arrow(self, table):
+        """Convert an Arrow table, dictionary-encoding categorical string columns"""
+        import pyarrow as pa
+
+        for i, name in enumerate(table.column_names):
+            field_type = table.schema.field(i).type
+            if name in self.categorical and (pa.types.is_string(field_type) or pa.types.is_large_string(field_type)):
+                table = table.set_column(i, name, table.column(i).dictionary_encode())
+        return table.to_pandas()
+
+    def _open_arrow(self):
+        """Arrow IPC reader, memory-mapping paths"""
+        import pyarrow as pa
+
+        source = self.source
+        if isinstance(source, (str, os.PathLike)):
+            source = pa.memory_map(os.fspath(source), 'r')
+        return pa.ipc.open_file(source)
+
+    def _csv_options(self):
+        """``pd.read_csv`` options that project columns while recording the header"""
+        self._header = []
+
+        def keep_column(name):
+            self._header.append(name)
+            return self.columns is None or name in self.columns
+
+        options = dict(self.read_csv_kwargs)
+        options.setdefault('usecols', keep_column)
+        return options
@@ -0,0 +1,65 @@
+from .mergeable import MergeableState
+
+# Column kinds in order of precedence when chunks disagree: a column that is
+# a string anywhere is a string column, one that is a float anywhere is float
+KIND_PRECEDENCE = {'int': 0, 'float': 1, 'object': 2}
+
+
+class CleaningStatistics(MergeableState):
+    """Mergeable statistics for fitting ``DataCleaner`` without loading all data.
+
+    Holds, per column, its kind (int, float or object), a quantile sketch for
+    numeric columns, exact label counts for string and encoded columns, and
+    null counts. States from chunks or partitions combine with ``merge``;
+    merging in a fixed order gives the same result on every run.
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self.kinds = {}         # Column -> 'int', 'float' or 'object'
+        self.sketches = {}      # Numeric column -> KLLSketch
+        self.label_counts = {}  # String or encoded column -> Series of counts per label
+        self.null_counts = {}
+
+    def merge(self, other):
+        """Combine with the statistics of another chunk or partition"""
+        merged = CleaningStatistics()
+        merged.n_rows = self.n_rows + other.n_rows
+
+        for col in list(self.kinds) + [c for c in other.kinds if c not in self.kinds]:
+            kinds = [stats.kinds[col] for stats in (self, other) if col in stats.kinds]
+            merged.kinds[col] = max(kinds, key=KIND_PRECEDENCE.get)
+            merged.null_counts[col] = self.null_counts.get(col, 0) + other.null_counts.get(col, 0)
+
+        for col in list(self.sketches) + [c for c in other.sketches if c not in self.sketches]:
+            if col in self.sketches and col in other.sketches:
+                merged.sketches[col] = self.sketches[col].merge(other.sketches[col])
+            else:
+                merged.sketches[col] = self.sketches.get(col, other.sketches.get(col))
+
+        for col in list(self.label_counts) + [c for c in other.label_counts if c not in self.label_counts]:
+            if col in self.label_counts and col in other.label_counts:
+                merged.label_counts[col] = self.label_counts[col].add(
+                    other.label_counts[col], fill_value=0
+                ).astype('int64')
+            else:
+                merged.label_counts[col] = self.label_counts.get(col, other.label_counts.get(col))
+
+        return merged
+
+    def mode(self, col):
+        """Most frequent label, the smallest among ties like ``Series.mode``"""
+        counts = self.label_counts.get(col)
+        if counts is None or counts.empty:
+            return 'Unknown'
+        top = counts[counts == counts.max()].index
+        try:
+            return min(top)
+        except TypeError:  # Mixed, unorderable labels
+            return top[0]
+
+    def labels(self, col):
+        """Distinct non-null labels seen in a column"""
+        counts = self.label_counts.get(col)
+        return list(counts.index) if counts is not None else []
+
@@ -1,95 +1,573 @@
+import bisect
+import json
+import os
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import LabelEncoder, StandardScaler
 import logging
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
+from .chunked_source import ChunkedSource
+from .cleaning_statistics import CleaningStatistics
+from .sketches import KLLSketch
+from .summary_statistics import SummaryStatistics
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _partition_statistics(cleaner, partition):
+    """Worker entry point: fitting statistics for one partition, keeping exact medians"""
+    return cleaner.collect_statistics(cleaner._read_partition(partition), exact_medians=True)
+
+
+def _clean_partition(cleaner, partition, output_path):
+    """Worker entry point: transform one partition, writing it to Parquet if a path is given"""
+    cleaned = cleaner._transform_steps(cleaner._align_chunk(cleaner._read_partition(partition)))
+    if output_path is None:
+        return cleaned
+    cleaned.to_parquet(output_path, index=False)
+    return len(cleaned)
+
+
+def _partition_summary(cleaner, partition):
+    """Worker entry point: summary statistics for one partition"""
+    return SummaryStatistics.from_frame(cleaner._read_partition(partition))
+
 class DataCleaner:
-    def __init__(self):
-        self.label_encoders = {}
-        self.scaler = StandardScaler()
+    NUMERIC_COLUMNS = ['age', 'loan_amount', 'mpesa_transaction_count', 'income']
+    CATEGORICAL_COLUMNS = ['location', 'gender', 'business_type', 'education_level']
+    TARGET_COLUMN = 'loan_approved'
+    ID_COLUMNS = ['applicant_id']  # Identifiers are cleaned but never used as features
+    UNKNOWN_CODE = -1  # Code for categories not seen during fit
+    SKETCH_EXACT_LIMIT = 100000  # Values per column kept exactly before medians turn approximate
+    AGE_BINS = [18, 25, 35, 45, 55, 65, 100]
+    AGE_LABELS = ['18-25', '26-35', '36-45', '46-55', '56-65', '65+']
+    # Kenyan features as (name, operation, source columns), derived when every source is present
+    FEATURE_SPEC = (
+        ('financial_activity_score', 'log1p', ('mpesa_transaction_count',)),  # M-Pesa activity
+        ('age_group', 'age_bins', ('age',)),                                  # Credit scoring age bands
+        ('loan_to_income_ratio', 'ratio', ('loan_amount', 'income')),         # +1 avoids division by zero
+    )
+    
+    def __init__(self, compact_dtypes=False):
+        self.compact_dtypes = compact_dtypes  # Downcast cleaned output to the smallest safe dtypes
+        self.memory_report = None             # Per-column bytes before/after the last compaction
+        self.medians = {}       # Numeric column -> fill value
+        self.modes = {}         # Categorical column -> fill value
+        self.vocabularies = {}  # Encoded column -> sorted category labels
+        self.feature_names = []  # Layout of transform_record / to_feature_array output
+        self.columns = []       # Input column order seen at fit
+        self.is_fitted = False
+        self._column_kinds = {}   # Column -> kind across all chunks, set by fit_statistics
+        self._lookup_tables = {}  # Encoded column -> Index over its vocabulary
+        self._record_plan = ()    # Per-feature steps for transform_record, compiled at fit
+        self._record_features = ()  # FEATURE_SPEC entries whose sources are all fitted
+        self._plans = {}          # Input schema -> compiled batch transform plan
+        self._scaler = None
+    
+    @property
+    def scaler(self):
+        """StandardScaler, created on first use to keep sklearn out of import time"""
+        if self._scaler is None:
+            from sklearn.preprocessing import StandardScaler
+            self._scaler = StandardScaler()
+        return self._scaler
         
     def clean_credit_data(self, df):
-        """Clean and preprocess credit data for Kenyan context"""
-        logger.info("Starting data cleaning process...")
+        """Clean and preprocess credit data for Kenyan context (fit and transform)"""
+        return self.fit(df).transform(df)
+    
+    def fit(self, df):
+        """Learn imputation values and category vocabularies from training data"""
+        logger.info("Fitting data cleaner...")
         
-        # Create a copy to avoid modifying original
-        cleaned_df = df.copy()
+        self._fit_imputation(df)
         
-        # Handle missing values
-        cleaned_df = self._handle_missing_values(cleaned_df)
+        # Vocabularies are taken after imputation, matching what transform encodes
+        self.vocabularies = {}
+        for col in self.CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                # Category and bool columns have no fill value; their gaps encode as unknown
+                fill_value = self.modes.get(col, self.medians.get(col))
+                filled = df[col].dropna() if fill_value is None else df[col].fillna(fill_value)
+                self.vocabularies[col] = sorted(filled.astype(str).unique())
         
-        # Convert data types
-        cleaned_df = self._convert_data_types(cleaned_df)
+        self._column_kinds = {}
+        return self._finish_fit(df.columns)
+    
+    def transform(self, df):
+        """Apply the fitted cleaning steps without refitting anything"""
+        if not self.is_fitted:
+            raise RuntimeError("DataCleaner must be fitted before transform")
+        logger.info("Starting data cleaning process...")
         
-        # Encode categorical variables
-        cleaned_df = self._encode_categorical_variables(cleaned_df)
+        cleaned_df = self._transform_steps(df)
         
-        # Create Kenyan-specific features
-        cleaned_df = self._create_kenyan_features(cleaned_df)
+        if self.compact_dtypes:
+            cleaned_df = self.compact(cleaned_df)
         
         logger.info(f"Data cleaning completed. Final shape: {cleaned_df.shape}")
         return cleaned_df
     
-    def _handle_missing_values(self, df):
-        """Handle missing values in the dataset"""
+    def _transform_steps(self, df):
+        """Imputation, type conversion, encoding and feature creation as one fused plan.
+        
+        The plan is compiled once per input schema. Each column is read into
+        a NumPy buffer once, filled, converted or encoded in place, and the
+        Kenyan features are written into preallocated arrays; the output
+        frame is assembled once at the end instead of copying and
+        reassigning columns step by step.
+        """
+        schema = tuple(zip(df.columns, df.dtypes))
+        plan = self._plans.get(schema)
+        if plan is None:
+            plan = self._plans[schema] = self._compile_plan(df)
+        return self._run_plan(df, plan)
+    
+    def _compile_plan(self, df):
+        """Resolve each column and derived feature of a schema to one operation"""
+        steps = []
+        for col in df.columns:
+            fill_value = self.medians.get(col, self.modes.get(col))
+            if col in self.vocabularies:
+                fill_code = self._lookup_table(col).get_indexer([str(fill_value)])[0]
+                steps.append((col, 'encode', fill_code))
+            elif col in self.NUMERIC_COLUMNS and df[col].dtype.kind not in 'iuf':
+                # Missing values take the fill value; other unparsable values become NaN
+                steps.append((col, 'to_numeric', pd.to_numeric(pd.Series([fill_value]), errors='coerce')[0]))
+            elif col in self.medians and df[col].dtype.kind == 'f':
+                steps.append((col, 'fill_float', fill_value))
+            elif fill_value is not None:
+                steps.append((col, 'fill', fill_value))
+            else:
+                steps.append((col, 'keep', None))
+        
+        for name, operation, sources in self.FEATURE_SPEC:
+            if all(source in df.columns for source in sources):
+                steps.append((name, operation, sources))
+        return tuple(steps)
+    
+    def _run_plan(self, df, plan):
+        """Execute a compiled plan over the column buffers of ``df``"""
+        n = len(df)
+        columns = {}
+        for col, operation, arg in plan:
+            if operation == 'encode':
+                # Look up each distinct label once; missing values (-1) pick the fill code at the end
+                labels, uniques = pd.factorize(df[col])
+                table = self._lookup_table(col).get_indexer(uniques.astype(str))
+                columns[col] = np.append(table, arg).astype(np.int64)[labels]
+            elif operation == 'to_numeric':
+                missing = df[col].isna().to_numpy()
+                values = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64, copy=True)
+                values[missing] = arg
+                columns[col] = values
+            elif operation == 'fill_float':
+                values = df[col].to_numpy(dtype=np.float64, copy=True)
+                np.copyto(values, arg, where=np.isnan(values))
+                columns[col] = values
+            elif operation == 'fill':
+                column = df[col]
+                missing = column.isna().to_numpy()
+                if missing.any() and column.dtype == object:
+                    values = column.to_numpy(copy=True)
+                    values[missing] = arg
+                    columns[col] = values
+                else:
+                    columns[col] = (column.fillna(arg) if missing.any() else column).array
+            elif operation == 'keep':
+                columns[col] = df[col].array
+            elif operation == 'log1p':
+                out = np.empty(n, dtype=np.float64)
+                columns[col] = np.log1p(self._as_float(columns[arg[0]]), out=out)
+            elif operation == 'age_bins':
+                codes = np.digitize(self._as_float(columns[arg[0]]), self.AGE_BINS, right=True) - 1
+                codes[codes >= len(self.AGE_LABELS)] = -1  # Above the top bin or NaN
+                columns[col] = pd.Categorical.from_codes(codes, categories=self.AGE_LABELS, ordered=True)
+            elif operation == 'ratio':
+                out = np.add(self._as_float(columns[arg[1]]), 1, out=np.empty(n, dtype=np.float64))
+                columns[col] = np.divide(self._as_float(columns[arg[0]]), out, out=out)
+        
+        return pd.DataFrame(columns, index=df.index, copy=False)
+    
+    @staticmethod
+    def _as_float(values):
+        """Float view of a plan buffer, converting extension arrays once"""
+        if isinstance(values, np.ndarray):
+            return values
+        return values.to_numpy(dtype=np.float64, na_value=np.nan)
+    
+    def collect_statistics(self, df, exact_medians=False):
+        """Mergeable fitting statistics for one chunk or partition of data.
+        
+        Numeric sketches stay exact up to ``SKETCH_EXACT_LIMIT`` values per
+        column, or without limit when ``exact_medians`` is set.
+        """
+        exact_limit = np.inf if exact_medians else self.SKETCH_EXACT_LIMIT
+        stats = CleaningStatistics()
+        stats.n_rows = len(df)
+        null_counts = df.isnull().sum()
+        numerical_cols = set(df.select_dtypes(include=[np.number]).columns)
+        string_cols = set(df.select_dtypes(include=['object', 'string']).columns)
+        
+        for col in df.columns:
+            if col in numerical_cols:
+                kind = 'float' if df[col].dtype.kind == 'f' else 'int'
+                stats.sketches[col] = KLLSketch(exact_limit=exact_limit).update(
+                    df[col].to_numpy(dtype=np.float64)
+                )
+            elif col in string_cols:
+                kind = 'object'
+            else:
+                continue
+            stats.kinds[col] = kind
+            stats.null_counts[col] = int(null_counts[col])
+            if kind == 'object' or col in self.CATEGORICAL_COLUMNS:
+                stats.label_counts[col] = df[col].value_counts(dropna=True)
+        
+        return stats
+    
+    def fit_statistics(self, stats):
+        """Fit from merged ``CleaningStatistics`` instead of an in-memory frame.
+        
+        Modes and vocabularies are exact; medians come from the quantile
+        sketches and are exact while the sketches hold every value (see
+        ``collect_statistics``).
+        """
+        self.medians = {col: stats.sketches[col].median()
+                        for col, kind in stats.kinds.items() if kind != 'object'}
+        self.modes = {col: stats.mode(col) for col, kind in stats.kinds.items() if kind == 'object'}
+        
+        self.vocabularies = {}
+        for col in self.CATEGORICAL_COLUMNS:
+            if col in stats.kinds:
+                labels = stats.labels(col)
+                if stats.null_counts[col]:
+                    labels.append(self.modes.get(col, self.medians.get(col)))
+                self.vocabularies[col] = sorted({str(label) for label in labels})
+        
+        self._column_kinds = dict(stats.kinds)
+        return self._finish_fit(stats.kinds)
+    
+    def _finish_fit(self, columns):
+        """Fix the feature layout and precompute the single-record plan"""
+        self.columns = list(columns)
+        self.feature_names = [col for col in self.columns
+                              if (col in self.vocabularies or col in self.medians)
+                              and col != self.TARGET_COLUMN and col not in self.ID_COLUMNS]
+        self._record_features = tuple(
+            (name, operation, sources) for name, operation, sources in self.FEATURE_SPEC
+            if all(source in self.feature_names for source in sources)
+        )
+        self.feature_names += [name for name, _, _ in self._record_features]
+        
+        # (column, fill value, label -> code table or None, coerce to numeric)
+        self._record_plan = tuple(
+            (col,
+             self.medians.get(col, self.modes.get(col)),
+             {label: code for code, label in enumerate(self.vocabularies[col])} if col in self.vocabularies else None,
+             col in self.NUMERIC_COLUMNS)
+            for col in self.columns if col in self.feature_names
+        )
+        self._lookup_tables = {}
+        self._plans = {}
+        self.is_fitted = True
+        return self
+    
+    def transform_record(self, record):
+        """Clean and featurize one application given as a dict.
+        
+        Applies the fitted imputation, encoding and Kenyan features without
+        building a DataFrame and returns a float64 array laid out as
+        ``feature_names``, which leaves out the target and id columns; it
+        matches ``to_feature_array(transform(df))`` for the same row. Missing
+        keys are imputed. Only fitted, read-only state is used, so
+        concurrent calls from many threads are safe.
+        """
+        if not self.is_fitted:
+            raise RuntimeError("DataCleaner must be fitted before transform_record")
+        values = {}
+        features = np.empty(len(self.feature_names), dtype=np.float64)
+        for i, (col, fill_value, codes, coerce) in enumerate(self._record_plan):
+            value = record.get(col)
+            if value is None or value != value:  # Missing or NaN
+                value = fill_value
+            if codes is not None:
+                value = codes.get(str(value), self.UNKNOWN_CODE)
+            elif coerce or not isinstance(value, (int, float)):
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    value = np.nan
+            features[i] = value
+            values[col] = value
+        
+        for i, (name, operation, sources) in enumerate(self._record_features, len(self._record_plan)):
+            if operation == 'log1p':
+                features[i] = np.log1p(values[sources[0]])
+            elif operation == 'age_bins':
+                features[i] = self._age_group_code(values[sources[0]])
+            elif operation == 'ratio':
+                features[i] = values[sources[0]] / (values[sources[1]] + 1)
+        return features
+    
+    def _age_group_code(self, age):
+        """Index of the ``AGE_BINS`` interval holding ``age`` (right-inclusive), or -1"""
+        if not self.AGE_BINS[0] < age <= self.AGE_BINS[-1]:
+            return -1
+        return bisect.bisect_left(self.AGE_BINS, age) - 1
+    
+    def to_feature_array(self, cleaned_df):
+        """Numeric matrix of a transformed frame in ``feature_names`` order"""
+        features = np.empty((len(cleaned_df), len(self.feature_names)), dtype=np.float64)
+        for i, col in enumerate(self.feature_names):
+            column = cleaned_df[col]
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                column = column.cat.codes
+            features[:, i] = column.to_numpy(dtype=np.float64)
+        return features
+    
+    def fit_chunks(self, chunks):
+        """Fit from an iterable of DataFrame chunks, holding one chunk at a time"""
+        return self.fit_statistics(
+            CleaningStatistics.merge_all(self.collect_statistics(chunk) for chunk in chunks)
+        )
+    
+    def clean_csv_to_parquet(self, input_path, output_dir, chunksize=100000, partition_cols=None,
+                             **read_csv_kwargs):
+        """Two-pass out-of-core cleaning of a CSV into Parquet files.
+        
+        Pass one reads ``chunksize`` rows at a time to collect statistics and
+        fit; pass two re-reads, transforms and writes each chunk as its own
+        Parquet file (or into Hive-style ``partition_cols`` directories), so
+        peak memory is bounded by the chunk size rather than the input.
+        Categorical columns are read as strings so every chunk encodes
+        alike. Output keeps the uncompacted dtypes so all files share one
+        schema.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        source = self._source(input_path, **read_csv_kwargs)
+        
+        logger.info(f"Pass 1: collecting cleaning statistics from {input_path}")
+        self.fit_chunks(source.chunks(chunksize))
+        
+        logger.info(f"Pass 2: writing cleaned chunks to {output_dir}")
+        os.makedirs(output_dir, exist_ok=True)
+        schema, n_rows, n_chunks = None, 0, 0
+        for i, chunk in enumerate(source.chunks(chunksize)):
+            cleaned = self._transform_steps(self._align_chunk(chunk))
+            table = pa.Table.from_pandas(cleaned, preserve_index=False)
+            # Pin every file to the first chunk's schema
+            schema = table.schema if schema is None else schema
+            table = table.cast(schema)
+            if partition_cols:
+                pq.write_to_dataset(table, output_dir, partition_cols=partition_cols,
+                                    basename_template=f"part-{i:05d}-{{i}}.parquet")
+            else:
+                pq.write_table(table, os.path.join(output_dir, f"part-{i:05d}.parquet"))
+            n_rows += len(cleaned)
+            n_chunks += 1
+        
+        logger.info(f"Cleaned {n_rows} rows in {n_chunks} chunks")
+        return {'rows': n_rows, 'chunks': n_chunks, 'output_dir': output_dir}
+    
+    def fit_partitions(self, partitions, max_workers=None):
+        """Fit from partitions (DataFrames or CSV/Parquet paths) in a process pool.
+        
+        Each worker reduces one partition to ``CleaningStatistics``; the states
+        are merged in partition order, so the global vocabularies and fill
+        values do not depend on scheduling or worker count.
+        """
+        partitions = list(partitions)
+        states = self._map_partitions(_partition_statistics, [(p,) for p in partitions], max_workers)
+        return self.fit_statistics(CleaningStatistics.merge_all(states))
+    
+    def clean_partitions(self, partitions, output_dir=None, max_workers=None):
+        """Fit and clean partitions (e.g. one per county) across a process pool.
+        
+        The fit phase merges per-partition statistics into one global
+        encoding before any partition is transformed. Numeric values are
+        kept exactly for the median, so codes and fill values match a
+        single-process ``clean_credit_data`` over the concatenated data.
+        Returns the cleaned frames in partition order, or with ``output_dir``
+        writes ``part-NNNNN.parquet`` per partition and returns a summary.
+        Output keeps the uncompacted dtypes so partitions share one schema.
+        """
+        partitions = list(partitions)
+        self.fit_partitions(partitions, max_workers)
+        
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+        tasks = [
+            (partition, None if output_dir is None else os.path.join(output_dir, f"part-{i:05d}.parquet"))
+            for i, partition in enumerate(partitions)
+        ]
+        results = self._map_partitions(_clean_partition, tasks, max_workers)
+        if output_dir is None:
+            return results
+        
+        logger.info(f"Cleaned {sum(results)} rows in {len(partitions)} partitions")
+        return {'rows': sum(results), 'partitions': len(partitions), 'output_dir': output_dir}
+    
+    def _map_partitions(self, worker, tasks, max_workers):
+        """Run ``worker(self, *task)`` for every task, in a process pool when worthwhile, keeping task order"""
+        max_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        if max_workers <= 1:
+            return [worker(self, *task) for task in tasks]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(worker, [self] * len(tasks), *zip(*tasks)))
+    
+    def _read_partition(self, partition):
+        """Load a partition given as a DataFrame or a CSV, Parquet or Arrow path"""
+        return self._source(partition).read()
+    
+    def _source(self, data, **read_csv_kwargs):
+        """Reader for a frame or file; categorical CSV columns are read as strings so every chunk encodes alike"""
+        read_csv_kwargs.setdefault('dtype', {col: str for col in self.CATEGORICAL_COLUMNS})
+        return ChunkedSource(data, **read_csv_kwargs)
+    
+    def _align_chunk(self, chunk):
+        """Cast a chunk's columns to the kinds seen across the whole input.
+        
+        A chunk may infer int where the file has gaps elsewhere, or float
+        where a string column happens to be empty; casting first keeps
+        imputation and encoding identical across chunks.
+        """
+        casts = {}
+        for col in chunk.columns:
+            kind = self._column_kinds.get(col)
+            if kind == 'float' and chunk[col].dtype.kind != 'f':
+                casts[col] = np.float64
+            elif kind == 'object' and chunk[col].dtype.kind in 'iufb':
+                casts[col] = object
+        return chunk.astype(casts) if casts else chunk
+    
+    def save(self, path):
+        """Save the fitted state as a compact JSON artifact"""
+        if not self.is_fitted:
+            raise RuntimeError("DataCleaner must be fitted before saving")
+        state = {
+            'version': 1,
+            'medians': self.medians,
+            'modes': {col: self._to_json_scalar(value) for col, value in self.modes.items()},
+            'vocabularies': self.vocabularies,
+            'columns': self.columns
+        }
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(state, fh, separators=(',', ':'))
+    
+    @classmethod
+    def load(cls, path):
+        """Restore a fitted cleaner from an artifact written by ``save``"""
+        with open(path, 'r', encoding='utf-8') as fh:
+            state = json.load(fh)
+        cleaner = cls()
+        cleaner.medians = state['medians']
+        cleaner.modes = state['modes']
+        cleaner.vocabularies = state['vocabularies']
+        return cleaner._finish_fit(state.get('columns', list(cleaner.medians) + list(cleaner.modes)))
+    
+    @staticmethod
+    def _to_json_scalar(value):
+        """Convert NumPy scalars to plain Python values for JSON"""
+        return value.item() if isinstance(value, np.generic) else value
+    
+    def _fit_imputation(self, df):
+        """Compute all numeric medians and categorical modes in one pass each"""
         # For numerical columns, fill with median
-        numerical_cols = df.select_dtypes(include=[np.number]).columns
-        for col in numerical_cols:
-            if df[col].isnull().sum() > 0:
-                df[col].fillna(df[col].median(), inplace=True)
-        
-        # For categorical columns, fill with mode
-        categorical_cols = df.select_dtypes(include=['object']).columns
-        for col in categorical_cols:
-            if df[col].isnull().sum() > 0:
-                df[col].fillna(df[col].mode()[0] if not df[col].mode().empty else 'Unknown', inplace=True)
-        
-        return df
-    
-    def _convert_data_types(self, df):
-        """Convert data types appropriately"""
-        # Convert potential numeric columns stored as strings
-        numeric_columns = ['age', 'loan_amount', 'mpesa_transaction_count', 'income']
-        for col in numeric_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        numerical_cols = list(df.select_dtypes(include=[np.number]).columns)
+        self.medians = {}
+        if numerical_cols:
+            # One consolidated float block and a single vectorized reduction over its columns
+            block = df[numerical_cols].to_numpy(dtype=np.float64)
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN columns get a NaN median
+                medians = np.nanmedian(block, axis=0)
+            self.medians = dict(zip(numerical_cols, medians.tolist()))
         
-        return df
+        # For categorical columns, fill with mode ('Unknown' when a column is empty)
+        self.modes = {}
+        for col in df.select_dtypes(include=['object', 'string']).columns:
+            try:
+                codes, uniques = pd.factorize(df[col], sort=True)
+            except TypeError:  # Mixed, unorderable labels
+                codes, uniques = pd.factorize(df[col])
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            # argmax takes the first, i.e. smallest, label among ties like Series.mode
+            self.modes[col] = uniques[counts.argmax()] if len(uniques) else 'Unknown'
     
-    def _encode_categorical_variables(self, df):
-        """Encode categorical variables for Kenyan context"""
-        categorical_columns = ['location', 'gender', 'business_type', 'education_level']
+    def _lookup_table(self, col):
+        """Hashed label -> code table for an encoded column, built once per fit"""
+        table = self._lookup_tables.get(col)
+        if table is None:
+            table = self._lookup_tables[col] = pd.Index(self.vocabularies[col])
+        return table
+    
+    def compact(self, df):
+        """Downcast every column to the smallest dtype that holds its values exactly.
         
-        for col in categorical_columns:
-            if col in df.columns:
-                self.label_encoders[col] = LabelEncoder()
-                df[col] = self.label_encoders[col].fit_transform(df[col].astype(str))
+        Integers (and integral floats without gaps) shrink to the narrowest
+        signed integer, other floats become float32 when that round-trips
+        exactly, encoded categoricals become int8/int16 codes and remaining
+        low-cardinality strings become ``category``. Bytes per column before
+        and after are stored in ``memory_report``.
+        """
+        compacted = pd.DataFrame({col: self._compact_column(df[col]) for col in df.columns},
+                                 index=df.index)
         
-        return df
+        before = df.memory_usage(deep=True, index=False)
+        after = compacted.memory_usage(deep=True, index=False)
+        self.memory_report = pd.DataFrame({
+            'dtype_before': df.dtypes.astype(str),
+            'dtype_after': compacted.dtypes.astype(str),
+            'bytes_before': before,
+            'bytes_after': after,
+            'reduction': 1 - after / before.where(before > 0)
+        })
+        logger.info(f"Compacted memory from {before.sum() / 1e6:.1f} MB to {after.sum() / 1e6:.1f} MB")
+        return compacted
     
-    def _create_kenyan_features(self, df):
-        """Create features specific to Kenyan financial context"""
-        # Create financial behavior score based on M-Pesa activity
-        if 'mpesa_transaction_count' in df.columns:
-            df['financial_activity_score'] = np.log1p(df['mpesa_transaction_count'])
+    @staticmethod
+    def _compact_column(series):
+        """Smallest exact dtype for one column"""
+        kind = series.dtype.kind
         
-        # Create age groups relevant to credit scoring
-        if 'age' in df.columns:
-            df['age_group'] = pd.cut(df['age'], 
-                                   bins=[18, 25, 35, 45, 55, 65, 100],
-                                   labels=['18-25', '26-35', '36-45', '46-55', '56-65', '65+'])
+        if kind in 'iu':
+            return pd.to_numeric(series, downcast='integer')
         
-        # Create loan-to-income ratio if both exist
-        if 'loan_amount' in df.columns and 'income' in df.columns:
-            df['loan_to_income_ratio'] = df['loan_amount'] / (df['income'] + 1)  # +1 to avoid division by zero
+        if kind == 'f':
+            values = series.to_numpy()
+            finite = np.isfinite(values)
+            if finite.all() and np.array_equal(values, np.floor(values)):
+                return pd.to_numeric(series, downcast='integer')
+            narrowed = values.astype(np.float32)
+            if np.array_equal(narrowed.astype(np.float64), values, equal_nan=True):
+                return pd.Series(narrowed, index=series.index, name=series.name)
+            return series
         
-        return df
+        if kind in 'OUT' or pd.api.types.is_string_dtype(series.dtype):
+            if series.nunique(dropna=True) <= len(series) // 2:
+                return series.astype('category')
+        
+        return series
     
-    def get_data_summary(self, df):
-        """Generate comprehensive data summary"""
+    def get_data_summary(self, df, approximate=False, chunksize=100000, max_workers=None):
+        """Generate comprehensive data summary
+        
+        With ``approximate=True`` the summary is built in one pass from
+        mergeable sketches instead of the full frame: ``df`` may then also be
+        a CSV or Parquet path (read ``chunksize`` rows at a time) or a list of
+        partitions (summarized in a process pool and merged in order).
+        Counts, nulls, mean, std, min and max stay exact; quartiles come from
+        KLL sketches (rank error around 1%) and ``distinct_counts`` from
+        HyperLogLog (relative error around 1.6%).
+        """
+        if approximate:
+            return self.summary_statistics(df, chunksize, max_workers).summary()
+        
         summary = {
             'shape': df.shape,
             'columns': list(df.columns),
@@ -98,3 +576,11 @@ class DataCleaner:
             'basic_stats': df.describe().to_dict() if len(df.select_dtypes(include=[np.number]).columns) > 0 else {}
         }
         return summary
+    
+    def summary_statistics(self, data, chunksize=100000, max_workers=None):
+        """Mergeable ``SummaryStatistics`` of a frame, a file or a list of partitions"""
+        if isinstance(data, (list, tuple)):
+            states = self._map_partitions(_partition_summary, [(p,) for p in data], max_workers)
+        else:
+            states = (SummaryStatistics.from_frame(chunk) for chunk in self._source(data).chunks(chunksize))
+        return SummaryStatistics.merge_all(states)
@@ -2,7 +2,20 @@
 Data processing modules for bias detection and data cleaning
 """
 
+from .batch_audit import BatchAuditor
 from .bias_detector import BiasDetector
+from .bias_monitor import BiasMonitor
+from .bias_statistics import BiasStatistics
+from .chunked_source import ChunkedSource
+from .cleaning_statistics import CleaningStatistics
 from .data_cleaner import DataCleaner
+from .mergeable import MergeableState
+from .mpesa_aggregator import MpesaAggregator
+from .report_cache import ReportCache
+from .sketches import HyperLogLog, KLLSketch
+from .summary_statistics import SummaryStatistics
+from .two_tier_cache import TwoTierCache
 
-__all__ = ["BiasDetector", "DataCleaner"]
+__all__ = ["BatchAuditor", "BiasDetector", "BiasMonitor", "BiasStatistics", "ChunkedSource", "CleaningStatistics",
+           "DataCleaner", "HyperLogLog", "KLLSketch", "MergeableState", "MpesaAggregator", "ReportCache",
+           "SummaryStatistics", "TwoTierCache"]
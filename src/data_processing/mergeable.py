@@ -0,0 +1,14 @@
+class MergeableState:
+    """Base for statistics built per chunk, file or partition and combined with ``merge``.
+
+    Subclasses implement ``merge(other)`` returning a new state and accept
+    no constructor arguments for the empty state.
+    """
+
+    @classmethod
+    def merge_all(cls, states):
+        """Combine an iterable of states in order"""
+        merged = None
+        for state in states:
+            merged = state if merged is None else merged.merge(state)
+        return merged if merged is not None else cls()
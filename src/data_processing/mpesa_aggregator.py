@@ -0,0 +1,199 @@
+import logging
+
+import numpy as np
+import pandas as pd
+
+from .chunked_source import ChunkedSource
+
+logger = logging.getLogger(__name__)
+
+NS_PER_DAY = 86400 * 10 ** 9
+DAY_BITS = 20  # Days since the epoch fit in 20 bits until the year 4840
+
+
+def _sorted_unique(keys, counts=None):
+    """Sorted distinct keys and their summed counts, by sorting rather than hashing"""
+    if counts is None:
+        keys = np.sort(keys)
+    else:
+        order = np.argsort(keys)
+        keys, counts = keys[order], counts[order]
+    starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+    if counts is None:
+        totals = np.diff(np.append(starts, len(keys)))
+    else:
+        totals = np.add.reduceat(counts, starts) if len(keys) else counts
+    return keys[starts], totals
+
+
+class MpesaAggregator:
+    """Stream raw M-Pesa transaction logs into per-applicant features.
+
+    Each log row is one transaction with an applicant id, a timestamp and a
+    signed amount (positive when money is received, negative when sent).
+    Applicant ids are hashed to dense integer codes with a pandas Index and
+    every statistic is a flat array indexed by code, updated per chunk with
+    ``np.bincount`` and ``np.maximum.at``; no per-applicant Python objects
+    are built. Active days and amount medians keep sparse sorted
+    ``(applicant, day)`` and ``(applicant, amount bin)`` keys that are
+    consolidated lazily, and medians are read from log-spaced bins
+    (``bins_per_decade=64`` bounds the relative error by about 2%).
+
+    ``features`` returns one row per applicant using the column names
+    ``DataCleaner`` already understands (``mpesa_transaction_count``,
+    ``mpesa_avg_transaction``) plus the new M-Pesa features.
+    """
+
+    def __init__(self, id_column='applicant_id', time_column='timestamp', amount_column='amount',
+                 period_days=None, bins_per_decade=64, max_decades=8):
+        self.id_column = id_column
+        self.time_column = time_column
+        self.amount_column = amount_column
+        self.period_days = period_days  # Scale counts to transactions per 30 days over this statement period
+        self.bins_per_decade = bins_per_decade
+        self.n_bins = bins_per_decade * max_decades  # Amount bins from KES 1 up to 10 ** max_decades
+        self.n_rows = 0
+
+        self._ids = pd.Index([])
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._amount_sums = np.zeros(0)
+        self._inflows = np.zeros(0)
+        self._outflows = np.zeros(0)
+        self._last_seen = np.zeros(0, dtype=np.int64)
+        self._day_keys = np.zeros(0, dtype=np.int64)   # Sorted unique code << DAY_BITS | day
+        self._bin_keys = np.zeros(0, dtype=np.int64)   # Sorted unique code * n_bins + amount bin
+        self._bin_counts = np.zeros(0, dtype=np.int64)
+        self._pending_days, self._pending_bins = [], []
+        self._pending_size = 0
+
+    def __len__(self):
+        return len(self._ids)
+
+    def update(self, log):
+        """Add one chunk of transaction log rows"""
+        log = log[[self.id_column, self.time_column, self.amount_column]].dropna()
+        if log.empty:
+            return self
+        self.n_rows += len(log)
+
+        codes = self._codes_for(log[self.id_column].array)
+        n = len(self._ids)
+        amounts = log[self.amount_column].to_numpy(dtype=np.float64)
+        sizes = np.abs(amounts)
+        timestamps = pd.to_datetime(log[self.time_column]).to_numpy('datetime64[ns]').view(np.int64)
+
+        self._counts += np.bincount(codes, minlength=n)
+        self._amount_sums += np.bincount(codes, weights=sizes, minlength=n)
+        self._inflows += np.bincount(codes, weights=np.where(amounts > 0, amounts, 0), minlength=n)
+        self._outflows += np.bincount(codes, weights=np.where(amounts < 0, -amounts, 0), minlength=n)
+        np.maximum.at(self._last_seen, codes, timestamps)
+
+        day_keys, _ = _sorted_unique((codes.astype(np.int64) << DAY_BITS) | (timestamps // NS_PER_DAY))
+        bin_keys, bin_counts = _sorted_unique(codes.astype(np.int64) * self.n_bins + self._amount_bins(sizes))
+        self._pending_days.append(day_keys)
+        self._pending_bins.append((bin_keys, bin_counts))
+        self._pending_size += len(day_keys) + len(bin_keys)
+        # Consolidate once the backlog outgrows the state, keeping the total work O(N log N)
+        if self._pending_size > len(self._day_keys) + len(self._bin_keys):
+            self._consolidate()
+        return self
+
+    def aggregate(self, source, chunksize=1000000, **read_csv_kwargs):
+        """Aggregate a frame, a CSV or Parquet path, or an iterable of frames chunk by chunk"""
+        columns = [self.id_column, self.time_column, self.amount_column]
+        for chunk in ChunkedSource(source, columns, **read_csv_kwargs).chunks(chunksize):
+            self.update(chunk)
+        return self
+
+    def features(self, as_of=None):
+        """Per-applicant feature frame.
+
+        ``mpesa_days_since_last`` is measured from ``as_of`` (default: the
+        latest transaction in the logs).
+        """
+        self._consolidate()
+        counts = self._counts
+        if as_of is None:
+            as_of_ns = self._last_seen.max() if len(self) else 0
+        else:
+            as_of_ns = pd.Timestamp(as_of).to_datetime64().astype('datetime64[ns]').view(np.int64)
+
+        transaction_count = counts.astype(np.float64)
+        if self.period_days is not None:
+            transaction_count = transaction_count * 30 / self.period_days
+
+        return pd.DataFrame({
+            self.id_column: self._ids.to_numpy(),
+            'mpesa_transaction_count': transaction_count,
+            'mpesa_avg_transaction': self._amount_sums / np.maximum(counts, 1),
+            'mpesa_median_transaction': self._medians(),
+            'mpesa_inflow_outflow_ratio': self._inflows / (self._outflows + 1),
+            'mpesa_active_days': np.bincount(self._day_keys >> DAY_BITS, minlength=len(self)),
+            'mpesa_days_since_last': (as_of_ns - self._last_seen) / NS_PER_DAY
+        })
+
+    def join(self, applications, as_of=None):
+        """Attach features to an application frame for ``DataCleaner``.
+
+        Applicants without any transactions get zero counts and active days;
+        their other M-Pesa features stay missing for the cleaner to impute.
+        M-Pesa columns already in ``applications`` (e.g. a precomputed
+        ``mpesa_transaction_count``) are replaced by the aggregated values,
+        with a warning.
+        """
+        features = self.features(as_of)
+        stale = [col for col in features.columns if col != self.id_column and col in applications.columns]
+        if stale:
+            logger.warning(f"Replacing {stale} in the application frame with features aggregated from the logs")
+            applications = applications.drop(columns=stale)
+        joined = applications.merge(features, on=self.id_column, how='left')
+        return joined.fillna({'mpesa_transaction_count': 0, 'mpesa_active_days': 0})
+
+    def _codes_for(self, ids):
+        """Dense codes for applicant ids, registering unseen ids"""
+        codes = self._ids.get_indexer(ids)
+        unseen = codes < 0
+        if unseen.any():
+            unseen_ids = np.asarray(ids[unseen])
+            new_ids = pd.Index(pd.unique(unseen_ids))
+            codes[unseen] = len(self._ids) + new_ids.get_indexer(unseen_ids)
+            self._ids = self._ids.append(new_ids)
+            grow = len(new_ids)
+            self._counts = np.concatenate([self._counts, np.zeros(grow, dtype=np.int64)])
+            self._amount_sums = np.concatenate([self._amount_sums, np.zeros(grow)])
+            self._inflows = np.concatenate([self._inflows, np.zeros(grow)])
+            self._outflows = np.concatenate([self._outflows, np.zeros(grow)])
+            self._last_seen = np.concatenate([self._last_seen, np.full(grow, np.iinfo(np.int64).min)])
+        return codes
+
+    def _amount_bins(self, sizes):
+        """Log-spaced bin of each absolute amount; amounts under KES 1 share the first bin"""
+        bins = np.floor(np.log10(np.maximum(sizes, 1.0)) * self.bins_per_decade)
+        return np.minimum(bins, self.n_bins - 1).astype(np.int64)
+
+    def _consolidate(self):
+        """Fold pending per-chunk keys into the sorted sparse state"""
+        if not self._pending_size:
+            return
+        self._day_keys, _ = _sorted_unique(np.concatenate([self._day_keys] + self._pending_days))
+        self._bin_keys, self._bin_counts = _sorted_unique(
+            np.concatenate([self._bin_keys] + [keys for keys, _ in self._pending_bins]),
+            np.concatenate([self._bin_counts] + [counts for _, counts in self._pending_bins])
+        )
+
+        self._pending_days, self._pending_bins = [], []
+        self._pending_size = 0
+
+    def _medians(self):
+        """Median absolute amount per applicant from its binned counts (middle pair averaged)"""
+        if not len(self):
+            return np.zeros(0)
+        codes = self._bin_keys // self.n_bins
+        centers = 10 ** ((self._bin_keys % self.n_bins + 0.5) / self.bins_per_decade)
+        cumulative = np.cumsum(self._bin_counts)
+        first = np.searchsorted(codes, np.arange(len(self)))
+        base = np.where(first > 0, cumulative[np.maximum(first - 1, 0)], 0)
+
+        low = np.searchsorted(cumulative, base + (self._counts - 1) // 2, side='right')
+        high = np.searchsorted(cumulative, base + self._counts // 2, side='right')
+        return (centers[low] + centers[high]) / 2
@@ -0,0 +1,60 @@
+import copy
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from .two_tier_cache import TwoTierCache
+
+
+class ReportCache(TwoTierCache):
+    """Content-addressed cache for bias reports.
+
+    Reports are keyed by a fingerprint of the audited columns together with
+    the detector settings that shape the report. Lookups go to an in-memory
+    LRU first and then, if ``cache_dir`` is set, to pickled reports on disk;
+    the disk tier evicts least recently used files once it grows past
+    ``max_disk_bytes``. Callers always receive their own copy of a report.
+    """
+
+    @staticmethod
+    def fingerprint(data, columns):
+        """Fast fingerprint of the ``columns`` of ``data``, or None if it cannot be taken.
+
+        In-memory frames and record arrays are hashed by content. Files are
+        identified by resolved path, size and modification time, so an
+        unchanged file is recognised without reading it. Open file objects
+        are not fingerprinted.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+
+        # The full shape is part of the key because reports carry ``dataset_shape``
+        if isinstance(data, pd.DataFrame):
+            digest.update(repr(data.shape).encode())
+            for col in columns:
+                if col in data.columns:
+                    digest.update(f"{col}:{data[col].dtype}".encode())
+                    hashed = pd.util.hash_pandas_object(data[col], index=False)
+                    digest.update(hashed.to_numpy().tobytes())
+            return digest.hexdigest()
+
+        if isinstance(data, np.ndarray) and data.dtype.names is not None:
+            digest.update(repr((len(data), len(data.dtype.names))).encode())
+            for col in columns:
+                if col in data.dtype.names:
+                    digest.update(f"{col}:{data.dtype[col]}".encode())
+                    digest.update(np.ascontiguousarray(data[col]).tobytes())
+            return digest.hexdigest()
+
+        if isinstance(data, (str, os.PathLike)):
+            path = os.path.realpath(os.fspath(data))
+            stat = os.stat(path)
+            digest.update(f"{path}:{stat.st_size}:{stat.st_mtime_ns}:{','.join(columns)}".encode())
+            return digest.hexdigest()
+
+        return None
+
+    def _detach(self, report):
+        """Reports are nested dicts callers may edit, so each side gets its own copy"""
+        return copy.deepcopy(report)
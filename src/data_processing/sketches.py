@@ -0,0 +1,144 @@
+import numpy as np
+import pandas as pd
+
+
+class KLLSketch:
+    """Mergeable quantile sketch (Karnin, Lang & Liberty).
+
+    Values are kept in a hierarchy of compactors; an item at level ``h``
+    stands for ``2 ** h`` inputs. When a level overflows it is sorted and
+    every other item (random offset) is promoted, so the sketch stays at
+    roughly ``3k`` items while rank error is ``O(1/k)``. Until the first
+    compaction the sketch holds every value and answers exactly; set
+    ``exact_limit`` to postpone compaction until that many values arrive.
+    """
+
+    def __init__(self, k=256, exact_limit=0, seed=0):
+        self.k = k
+        self.exact_limit = exact_limit
+        self.n = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def is_exact(self):
+        """True while no compaction has discarded any value"""
+        return len(self.levels) == 1
+
+    def update(self, values):
+        """Add an array of values, ignoring NaNs"""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.n += len(values)
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+        return self
+
+    def merge(self, other):
+        """Sketch of the union of both inputs"""
+        merged = KLLSketch(self.k, self.exact_limit)
+        merged._rng = self._rng
+        merged.n = self.n + other.n
+        depth = max(len(self.levels), len(other.levels))
+        merged.levels = [
+            np.concatenate([levels[h] for levels in (self.levels, other.levels) if h < len(levels)])
+            for h in range(depth)
+        ]
+        merged._compress()
+        return merged
+
+    def quantile(self, q):
+        """Approximate ``q``-quantile (exact while ``is_exact``)"""
+        if self.n == 0:
+            return np.nan
+        if self.is_exact:
+            return float(np.quantile(self.levels[0], q))
+
+        items = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level), 2.0 ** h) for h, level in enumerate(self.levels)])
+        order = np.argsort(items, kind='stable')
+        cumulative = np.cumsum(weights[order])
+        rank = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+        return float(items[order][min(rank, len(items) - 1)])
+
+    def median(self):
+        """Approximate median, matching ``Series.median`` while exact"""
+        if self.n and self.is_exact:
+            return float(np.median(self.levels[0]))
+        return self.quantile(0.5)
+
+    def _capacity(self, level):
+        """Items a level may hold before it is compacted; lower levels get less room"""
+        depth = len(self.levels) - level - 1
+        return max(8, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Compact every overflowing level, promoting half its items upward"""
+        if self.is_exact and self.n <= self.exact_limit:
+            return
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so promoted pairs are exact halves
+                leftover, items = items[:len(items) % 2], items[len(items) % 2:]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level] = leftover
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch (Flajolet et al.).
+
+    Each value is hashed to 64 bits; the top ``precision`` bits pick one of
+    ``2 ** precision`` registers, which keeps the longest run of leading
+    zeros seen in the remaining bits. Relative error is about
+    ``1.04 / sqrt(2 ** precision)`` (1.6% at the default) in 4 KiB of
+    registers, and merging is an elementwise maximum.
+    """
+
+    def __init__(self, precision=12):
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, values):
+        """Add an array of values, ignoring nulls"""
+        if not isinstance(values, pd.Series):
+            values = pd.Series(np.asarray(values).ravel())
+        # Registers depend only on the set of values, so hash each distinct value once
+        values = np.asarray(values.dropna().unique())
+        if len(values):
+            hashes = pd.util.hash_array(values)
+            index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+            remainder = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+            # Position of the first set bit in the remaining bits, counted from the top
+            bit_length = np.searchsorted(_POWERS_OF_TWO, remainder, side='right')
+            ranks = (64 - self.precision - bit_length + 1).astype(np.uint8)
+            np.maximum.at(self.registers, index, ranks)
+        return self
+
+    def merge(self, other):
+        """Sketch of the union of both inputs"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        merged = HyperLogLog(self.precision)
+        merged.registers = np.maximum(self.registers, other.registers)
+        return merged
+
+    def count(self):
+        """Estimated number of distinct values"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # Linear counting for small cardinalities
+        return int(round(estimate))
+
+
+_POWERS_OF_TWO = np.uint64(1) << np.arange(64, dtype=np.uint64)
@@ -0,0 +1,118 @@
+import numpy as np
+
+from .cleaning_statistics import KIND_PRECEDENCE
+from .mergeable import MergeableState
+from .sketches import HyperLogLog, KLLSketch
+
+KIND_DTYPES = {'int': np.dtype('int64'), 'float': np.dtype('float64'), 'object': np.dtype('object')}
+
+
+class SummaryStatistics(MergeableState):
+    """Mergeable one-pass summary of a dataset too large to load.
+
+    Per column it keeps the kind, an exact null count and a HyperLogLog
+    distinct count; numeric columns add exact count, mean, variance, min
+    and max (combined with Chan's parallel update) and a KLL sketch for
+    quartiles. States from chunks or partitions combine with ``merge``.
+    """
+
+    def __init__(self, k=256, precision=12):
+        self.k = k                  # KLL accuracy parameter
+        self.precision = precision  # HyperLogLog register bits
+        self.n_rows = 0
+        self.kinds = {}        # Column -> 'int', 'float' or 'object'
+        self.null_counts = {}
+        self.distinct = {}     # Column -> HyperLogLog
+        self.sketches = {}     # Numeric column -> KLLSketch
+        self.moments = {}      # Numeric column -> (count, mean, M2, min, max)
+
+    @classmethod
+    def from_frame(cls, df, k=256, precision=12):
+        """Summary state of one chunk or partition"""
+        stats = cls(k, precision)
+        stats.n_rows = len(df)
+        null_counts = df.isnull().sum()
+        numerical_cols = set(df.select_dtypes(include=[np.number]).columns)
+
+        for col in df.columns:
+            stats.null_counts[col] = int(null_counts[col])
+            if col in numerical_cols:
+                stats.kinds[col] = 'float' if df[col].dtype.kind == 'f' else 'int'
+                values = df[col].to_numpy(dtype=np.float64)
+                values = values[~np.isnan(values)]
+                stats.sketches[col] = KLLSketch(k).update(values)
+                stats.moments[col] = (
+                    (len(values), values.mean(), ((values - values.mean()) ** 2).sum(), values.min(), values.max())
+                    if len(values) else (0, 0.0, 0.0, np.inf, -np.inf)
+                )
+            else:
+                stats.kinds[col] = 'object'
+                values = df[col]
+            stats.distinct[col] = HyperLogLog(precision).update(values)
+        return stats
+
+    def merge(self, other):
+        """Combine with the summary of another chunk or partition"""
+        merged = SummaryStatistics(self.k, self.precision)
+        merged.n_rows = self.n_rows + other.n_rows
+
+        for col in list(self.kinds) + [c for c in other.kinds if c not in self.kinds]:
+            kinds = [stats.kinds[col] for stats in (self, other) if col in stats.kinds]
+            merged.kinds[col] = max(kinds, key=KIND_PRECEDENCE.get)
+            merged.null_counts[col] = self.null_counts.get(col, 0) + other.null_counts.get(col, 0)
+            merged.distinct[col] = self._merged(other, 'distinct', col)
+            if merged.kinds[col] != 'object':
+                merged.sketches[col] = self._merged(other, 'sketches', col)
+                merged.moments[col] = self._merged_moments(
+                    self.moments.get(col, (0, 0.0, 0.0, np.inf, -np.inf)),
+                    other.moments.get(col, (0, 0.0, 0.0, np.inf, -np.inf))
+                )
+
+        return merged
+
+    def summary(self):
+        """Summary in the layout of ``DataCleaner.get_data_summary``, plus distinct counts"""
+        numerical_cols = [col for col, kind in self.kinds.items() if kind != 'object']
+        basic_stats = {}
+        for col in numerical_cols:
+            count, mean, m2, low, high = self.moments[col]
+            sketch = self.sketches[col]
+            basic_stats[col] = {
+                'count': float(count),
+                'mean': mean if count else np.nan,
+                'std': np.sqrt(m2 / (count - 1)) if count > 1 else np.nan,
+                'min': low if count else np.nan,
+                '25%': sketch.quantile(0.25),
+                '50%': sketch.quantile(0.5),
+                '75%': sketch.quantile(0.75),
+                'max': high if count else np.nan
+            }
+
+        return {
+            'shape': (self.n_rows, len(self.kinds)),
+            'columns': list(self.kinds),
+            'data_types': {col: KIND_DTYPES[kind] for col, kind in self.kinds.items()},
+            'missing_values': dict(self.null_counts),
+            'distinct_counts': {col: sketch.count() for col, sketch in self.distinct.items()},
+            'basic_stats': basic_stats
+        }
+
+    def _merged(self, other, field, col):
+        """Merge one column's sketch from both states, either of which may lack it"""
+        mine, theirs = getattr(self, field).get(col), getattr(other, field).get(col)
+        if mine is None or theirs is None:
+            return mine if theirs is None else theirs
+        return mine.merge(theirs)
+
+    @staticmethod
+    def _merged_moments(a, b):
+        """Chan et al. pairwise combination of (count, mean, M2, min, max)"""
+        n_a, mean_a, m2_a, min_a, max_a = a
+        n_b, mean_b, m2_b, min_b, max_b = b
+        n = n_a + n_b
+        if n == 0:
+            return a
+        delta = mean_b - mean_a
+        mean = mean_a + delta * n_b / n
+        m2 = m2_a + m2_b + delta ** 2 * n_a * n_b / n
+        return (n, mean, m2, min(min_a, min_b), max(max_a, max_b))
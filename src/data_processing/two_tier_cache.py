@@ -0,0 +1,108 @@
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+
+
+class TwoTierCache:
+    """In-memory LRU in front of an optional pickled disk tier.
+
+    Lookups go to the in-memory LRU first and then, if ``cache_dir`` is set,
+    to pickled values on disk, where other processes and later runs find
+    them. The disk tier evicts least recently used files once it grows past
+    ``max_disk_bytes``. Subclasses decide how keys are fingerprinted and may
+    override ``_detach`` to hand out copies instead of shared objects.
+    """
+
+    def __init__(self, max_entries=128, cache_dir=None, max_disk_bytes=256 * 1024 ** 2):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get(self, key):
+        """Cached value for ``key`` or None"""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._detach(self._memory[key])
+
+        path = self._disk_path(key)
+        if path is not None and os.path.exists(path):
+            try:
+                with open(path, 'rb') as fh:
+                    value = pickle.load(fh)
+            except (OSError, pickle.UnpicklingError, EOFError):
+                value = None
+            if value is not None:
+                os.utime(path)  # Mark as recently used for eviction
+                self._remember(key, value)
+                self.hits += 1
+                return self._detach(value)
+
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        """Store a value in memory and, when configured, on disk"""
+        self._remember(key, self._detach(value))
+
+        path = self._disk_path(key)
+        if path is not None:
+            # Write atomically so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as fh:
+                pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            self._evict_disk()
+
+    def clear(self):
+        """Drop every cached value from both tiers"""
+        self._memory.clear()
+        if self.cache_dir is not None:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def _detach(self, value):
+        """Value handed to or taken from callers; shared as-is by default"""
+        return value
+
+    def _remember(self, key, value):
+        """Insert into the in-memory LRU, dropping the oldest entries beyond capacity"""
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _disk_path(self, key):
+        """File backing ``key`` in the disk tier, or None without one"""
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _evict_disk(self):
+        """Remove least recently used files until the disk tier fits its budget"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
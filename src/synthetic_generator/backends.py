@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+
+
+class CTGANBackend:
+    """CTGAN from SDV; slow to train but models complex joint structure"""
+
+    name = 'ctgan'
+
+    def __init__(self, epochs=100, batch_size=500):
+        self.epochs = epochs
+        self.batch_size = batch_size
+
+    def params(self):
+        """Settings that change the trained model, part of its cache key"""
+        return {'model': self.name, 'epochs': self.epochs, 'batch_size': self.batch_size}
+
+    def train(self, data):
+        """Fit a new CTGAN (torch and sdv are only loaded when training)"""
+        from sdv.tabular import CTGAN
+
+        model = CTGAN(epochs=self.epochs, batch_size=self.batch_size)
+        model.fit(data)
+        return model
+
+
+class GaussianCopulaBackend:
+    """Gaussian copula with empirical marginals, fitted in seconds with NumPy"""
+
+    name = 'copula'
+
+    def __init__(self, n_quantiles=1000, max_categories=20, random_state=0):
+        self.n_quantiles = n_quantiles        # Points kept per numeric marginal
+        self.max_categories = max_categories  # Numeric columns with few values are modelled as categories
+        self.random_state = random_state      # Seeds the jitter used while fitting
+
+    def params(self):
+        """Settings that change the trained model, part of its cache key"""
+        return {'model': self.name, 'n_quantiles': self.n_quantiles,
+                'max_categories': self.max_categories, 'random_state': self.random_state}
+
+    def train(self, data):
+        """Fit a new copula model"""
+        return GaussianCopulaModel(self.n_quantiles, self.max_categories).fit(
+            data, np.random.default_rng(self.random_state)
+        )
+
+
+class GaussianCopulaModel:
+    """Joint model of mixed-type columns through a Gaussian copula.
+
+    Each column is mapped to a standard normal score through its own
+    marginal: numeric columns through their empirical CDF (kept as
+    ``n_quantiles`` quantiles), categorical columns through a slice of
+    (0, 1) per category, sized by frequency, with a uniform jitter inside
+    the slice; numeric columns with at most ``max_categories`` distinct
+    values are treated as categorical. The correlation of the scores is
+    the only joint structure learned. Sampling draws correlated normals
+    and maps each back through the inverse marginal. Missing numeric
+    values are drawn independently at their observed rate. Like CTGAN,
+    sampling uses NumPy's global RNG, so seeding it reproduces samples.
+    """
+
+    def __init__(self, n_quantiles=1000, max_categories=20):
+        self.n_quantiles = n_quantiles
+        self.max_categories = max_categories
+        self.columns = []
+        self.marginals = {}  # Column -> ('numeric', ...) or ('categorical', ...) description
+        self.cholesky = None
+
+    def fit(self, data, rng):
+        """Learn marginals and the score correlation from a frame"""
+        from scipy.special import ndtri
+
+        self.columns = list(data.columns)
+        scores = np.empty((len(data), len(self.columns)))
+        for j, col in enumerate(self.columns):
+            column = data[col]
+            kind = column.dtype.kind
+            if kind == 'M' or (kind in 'iuf' and column.nunique() > self.max_categories):
+                uniform = self._fit_numeric(col, column, rng)
+            else:
+                uniform = self._fit_categorical(col, column, rng)
+            scores[:, j] = ndtri(uniform)
+
+        correlation = np.eye(len(self.columns))
+        if len(data) > 1:
+            correlation = np.nan_to_num(np.atleast_2d(np.corrcoef(scores, rowvar=False)))
+            np.fill_diagonal(correlation, 1.0)
+        # Clip to positive definite so the Cholesky factor exists
+        eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+        correlation = (eigenvectors * np.maximum(eigenvalues, 1e-6)) @ eigenvectors.T
+        scale = np.sqrt(np.diag(correlation))
+        self.cholesky = np.linalg.cholesky(correlation / np.outer(scale, scale))
+        return self
+
+    def sample(self, num_rows):
+        """Draw ``num_rows`` synthetic rows"""
+        from scipy.special import ndtr
+
+        uniform = ndtr(np.random.standard_normal((num_rows, len(self.columns))) @ self.cholesky.T)
+        columns = {}
+        for j, col in enumerate(self.columns):
+            marginal = self.marginals[col]
+            if marginal[0] == 'numeric':
+                columns[col] = self._sample_numeric(marginal, uniform[:, j])
+            else:
+                _, values, cumulative = marginal
+                codes = np.minimum(np.searchsorted(cumulative, uniform[:, j], side='right'), len(values) - 1)
+                columns[col] = values.take(codes)
+        return pd.DataFrame(columns)
+
+    def _fit_numeric(self, col, column, rng):
+        """Empirical CDF marginal; returns each row's uniform score"""
+        is_datetime = column.dtype.kind == 'M'
+        if is_datetime:
+            values = column.to_numpy(dtype='datetime64[ns]').view(np.int64).astype(np.float64)
+            values[column.isna().to_numpy()] = np.nan
+        else:
+            values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        order = np.argsort(values[~missing])
+        observed = values[~missing][order]
+        n = len(observed)
+
+        uniform = rng.random(len(values))  # Missing rows carry no information about the others
+        if n:
+            # Mid-rank of every value from its run of ties in sorted order
+            starts = np.flatnonzero(np.concatenate([[True], observed[1:] != observed[:-1]]))
+            ends = np.append(starts[1:], n)
+            ranks = np.empty(n)
+            ranks[order] = np.repeat((starts + ends) / (2.0 * n), ends - starts)
+            uniform[~missing] = ranks
+            quantiles = np.quantile(observed, np.linspace(0, 1, min(self.n_quantiles, n)))
+        else:
+            quantiles = np.zeros(1)
+        np.clip(uniform, 0.5 / max(n, 1), 1 - 0.5 / max(n, 1), out=uniform)
+
+        # Whole-number floats (ages, counts with gaps) are sampled as whole numbers
+        is_integer = column.dtype.kind in 'iu' or bool(np.all(quantiles == np.round(quantiles)))
+        self.marginals[col] = ('numeric', quantiles, missing.mean(), column.dtype, is_integer, is_datetime)
+        return uniform
+
+    def _fit_categorical(self, col, column, rng):
+        """Frequency-sliced marginal; returns each row's uniform score"""
+        codes, values = pd.factorize(column, use_na_sentinel=False)
+        counts = np.bincount(codes, minlength=len(values))
+        cumulative = np.cumsum(counts) / len(codes)
+        lower = cumulative - counts / len(codes)
+        self.marginals[col] = ('categorical', values, cumulative)
+        return np.clip(lower[codes] + rng.random(len(codes)) * (counts / len(codes))[codes], 1e-9, 1 - 1e-9)
+
+    @staticmethod
+    def _sample_numeric(marginal, uniform):
+        """Invert the empirical CDF, then restore missing values and the original dtype"""
+        _, quantiles, missing_rate, dtype, is_integer, is_datetime = marginal
+        if is_integer:
+            # Nearest grid point keeps the frequencies of repeated whole numbers
+            values = quantiles[np.rint(uniform * (len(quantiles) - 1)).astype(np.int64)]
+        else:
+            values = np.interp(uniform, np.linspace(0, 1, len(quantiles)), quantiles)
+        if missing_rate:
+            values[np.random.random(len(values)) < missing_rate] = np.nan
+        if is_datetime:
+            return pd.to_datetime(np.round(values), unit='ns').astype(dtype)
+        if dtype.kind in 'iu' and not missing_rate:
+            return values.astype(dtype)
+        return values
@@ -1,11 +1,5 @@
 import pandas as pd
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import accuracy_score, roc_auc_score
-import matplotlib.pyplot as plt
-import seaborn as sns
-from scipy import stats
 
 class DataValidator:
     def __init__(self):
@@ -39,6 +33,8 @@ class DataValidator:
     
     def _validate_statistical_similarity(self, original, synthetic, target_column):
         """Validate statistical properties between original and synthetic data"""
+        from scipy import stats
+        
         results = {}
         
         numerical_cols = original.select_dtypes(include=[np.number]).columns
@@ -57,6 +53,10 @@ class DataValidator:
     
     def _validate_ml_utility(self, original, synthetic, target_column):
         """Validate that synthetic data maintains machine learning utility"""
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import accuracy_score, roc_auc_score
+        
         if target_column not in original.columns:
             return {"error": f"Target column '{target_column}' not found"}
         
@@ -118,6 +118,8 @@ class DataValidator:
     
     def generate_validation_report(self, validation_report, save_path=None):
         """Generate a comprehensive validation report"""
+        import matplotlib.pyplot as plt
+        
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
         
         # Plot 1: Statistical similarity
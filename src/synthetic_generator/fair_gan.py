@@ -1,18 +1,71 @@
+import itertools
+import logging
+import os
+import pickle
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
 import pandas as pd
 import numpy as np
-import torch
-import torch.nn as nn
-from sdv.tabular import CTGAN
-from sklearn.preprocessing import StandardScaler
 import warnings
 warnings.filterwarnings('ignore')
 
+from .backends import CTGANBackend, GaussianCopulaBackend
+from .model_cache import ModelCache
+
+logger = logging.getLogger(__name__)
+
+_worker_generator = None  # Generator loaded once per sampling worker process
+
+
+def _load_worker_generator(path):
+    """Worker initializer: load the saved generator a single time per process"""
+    global _worker_generator
+    _worker_generator = FairDataGenerator.load(path)
+
+
+def _sample_shard(shard, num_samples, seed, batch_size, fair_columns, output_dir, file_format, partition_cols):
+    """Worker entry point: draw one shard with its own seed"""
+    return _worker_generator._sample_shard(shard, num_samples, seed, batch_size, fair_columns,
+                                           output_dir, file_format, partition_cols)
+
 class FairDataGenerator:
-    def __init__(self, epochs=100, batch_size=500):
+    ARTIFACT_VERSION = 1
+    BALANCE_MODES = ('fixed', 'over', 'under', 'quota')
+    MAX_QUOTA_LEVELS = 50  # Columns with at most this many values can be used as quota conditions
+    BACKENDS = {'ctgan': CTGANBackend, 'copula': GaussianCopulaBackend}
+    
+    def __init__(self, epochs=100, batch_size=500, cache=None, random_state=None, balance_mode='fixed',
+                 backend='ctgan'):
+        if balance_mode not in self.BALANCE_MODES:
+            raise ValueError(f"balance_mode must be one of {self.BALANCE_MODES}")
         self.epochs = epochs
         self.batch_size = batch_size
+        # Synthesizer: a name from BACKENDS or any object with params() and train(data)
+        if backend == 'ctgan':
+            backend = CTGANBackend(epochs, batch_size)
+        elif isinstance(backend, str):
+            if backend not in self.BACKENDS:
+                raise ValueError(f"backend must be one of {sorted(self.BACKENDS)} or a backend object")
+            backend = self.BACKENDS[backend]()
+        self.backend = backend
+        self.cache = cache       # Optional ModelCache shared by generators
+        self.random_state = random_state  # Root seed for balancing and sharded sampling
+        self.balance_mode = balance_mode  # 'fixed' keeps the sample size, 'over'/'under' match the largest/smallest cell,
+                                          # 'quota' draws each cell's share from the model instead of duplicating rows
+        self.category_values = {}  # Low-cardinality column -> values seen in training
         self.model = None
-        self.scaler = StandardScaler()
+        self.model_key = None    # Fingerprint of the training data and hyperparameters
+        self._scaler = None
+    
+    @property
+    def scaler(self):
+        """StandardScaler, created on first use to keep sklearn out of import time"""
+        if self._scaler is None:
+            from sklearn.preprocessing import StandardScaler
+            self._scaler = StandardScaler()
+        return self._scaler
         
     def generate_fair_data(self, original_data, num_samples=None, fair_columns=None):
         """Generate synthetic data with fairness constraints"""
@@ -21,50 +74,369 @@ class FairDataGenerator:
             
         if fair_columns is None:
             fair_columns = ['location', 'gender']
+        
+        return self.fit(original_data).sample(num_samples, fair_columns)
+    
+    def fit(self, original_data):
+        """Train the synthesizer, reusing a cached model trained on the same data and settings"""
+        key = ModelCache.fingerprint(original_data, self._training_params())
+        model = self.cache.get(key) if self.cache is not None else None
+        if model is None:
+            model = self._train(original_data)
+            if self.cache is not None:
+                self.cache.put(key, model)
+        
+        self.model = model
+        self.model_key = key
+        self.category_values = {}
+        for col in original_data.columns:
+            values = original_data[col].dropna().unique()
+            if len(values) <= self.MAX_QUOTA_LEVELS:
+                try:
+                    values = sorted(values)
+                except TypeError:  # Mixed, unorderable values
+                    values = list(values)
+                self.category_values[col] = [value.item() if isinstance(value, np.generic) else value
+                                             for value in values]
+        return self
+    
+    def sample(self, num_samples, fair_columns=None):
+        """Draw synthetic rows from the fitted model, balancing ``fair_columns`` if given"""
+        if self.model is None:
+            raise RuntimeError("FairDataGenerator must be fitted before sampling")
+        
+        return self._draw(num_samples, fair_columns, np.random.default_rng(self.random_state))
+    
+    def sample_quotas(self, quotas, max_draws_per_row=50, rng=None):
+        """Draw exactly the requested number of rows for each protected cell.
+        
+        ``quotas`` is a DataFrame (or list of dicts) of condition columns
+        plus ``num_rows``, e.g. ``{'location': 'Rural', 'gender': 'Female',
+        'business_type': 'Informal', 'num_rows': 10000}``. SDV models sample
+        the conditions directly; other models are sampled in batches sized
+        from the observed acceptance rate, keeping matching rows until every
+        quota is met. At most ``max_draws_per_row`` rows are drawn per row
+        requested; quotas still short when that budget runs out are logged
+        and returned partially filled.
+        """
+        if self.model is None:
+            raise RuntimeError("FairDataGenerator must be fitted before sampling")
+        quotas = pd.DataFrame(quotas)
+        if 'num_rows' not in quotas.columns:
+            raise ValueError("quotas need a 'num_rows' column")
+        columns = [col for col in quotas.columns if col != 'num_rows']
+        quotas = quotas.groupby(columns, sort=False, dropna=False)['num_rows'].sum().reset_index()
+        rng = rng if rng is not None else np.random.default_rng(self.random_state)
+        
+        if type(self.model).__module__.startswith('sdv'):
+            from sdv.sampling import Condition
+            conditions = [Condition(dict(zip(columns, values)), num_rows=int(n))
+                          for values, n in zip(quotas[columns].itertuples(index=False), quotas['num_rows']) if n > 0]
+            result = self.model.sample_conditions(conditions, max_tries_per_batch=max_draws_per_row)
+        else:
+            result = self._sample_quotas_by_rejection(quotas, columns, max_draws_per_row)
+        return result.take(rng.permutation(len(result))).reset_index(drop=True)
+    
+    def _sample_quotas_by_rejection(self, quotas, columns, max_draws_per_row):
+        """Batched rejection sampling into quota cells under a draw budget"""
+        lookup = pd.MultiIndex.from_frame(quotas[columns])
+        remaining = quotas['num_rows'].to_numpy(dtype=np.int64).copy()
+        budget = max_draws_per_row * int(remaining.sum())
+        kept, drawn, accepted = [], 0, 0
+        
+        while remaining.sum() > 0 and drawn < budget:
+            # Size the batch to finish in one more draw at the acceptance rate seen so far
+            acceptance = max(accepted / drawn if drawn else 1.0, 1.0 / max_draws_per_row)
+            n = int(min(budget - drawn, max(1.2 * remaining.sum() / acceptance, 100), 1000000))
+            batch = self.model.sample(n)
+            drawn += n
+            
+            quota_index = lookup.get_indexer(pd.MultiIndex.from_frame(batch[columns]))
+            matched = np.flatnonzero(quota_index >= 0)
+            order = np.argsort(quota_index[matched], kind='stable')
+            matched, cells = matched[order], quota_index[matched][order]
+            rank = np.arange(len(cells)) - np.searchsorted(cells, cells)  # Position within each cell
+            keep = matched[rank < remaining[cells]]
             
-        # Train CTGAN model
-        self.model = CTGAN(epochs=self.epochs, batch_size=self.batch_size)
-        self.model.fit(original_data)
+            remaining -= np.bincount(quota_index[keep], minlength=len(remaining))
+            accepted += len(keep)
+            kept.append(batch.iloc[np.sort(keep)])
+        
+        if remaining.sum() > 0:
+            short = quotas.assign(num_rows=remaining)[remaining > 0]
+            logger.warning(f"Draw budget of {budget} rows exhausted with quotas unfilled:\n{short}")
+        if not kept:
+            return self._empty_sample()
+        return pd.concat(kept, ignore_index=True)
+    
+    def _empty_sample(self):
+        """Zero-row frame with the model's columns and dtypes"""
+        return self.model.sample(1).iloc[:0]
+    
+    def _equal_quotas(self, fair_columns, num_samples):
+        """Split ``num_samples`` evenly over every combination of the fair columns' training values.
+        
+        Columns absent from training or with more than ``MAX_QUOTA_LEVELS``
+        values are left out; returns None when no column is left.
+        """
+        columns = [col for col in fair_columns if col in self.category_values]
+        dropped = [col for col in fair_columns if col not in self.category_values]
+        if dropped:
+            logger.warning(f"Fair columns {dropped} are missing or have more than {self.MAX_QUOTA_LEVELS} "
+                           f"values and are not used as quota conditions")
+        if not columns:
+            return None
+        cells = list(itertools.product(*[self.category_values[col] for col in columns]))
+        counts = np.full(len(cells), num_samples // len(cells))
+        counts[:num_samples % len(cells)] += 1
+        return pd.DataFrame(cells, columns=columns).assign(num_rows=counts)
+    
+    def _draw(self, num_samples, fair_columns, rng):
+        """Sample and apply the configured balancing"""
+        if fair_columns and self.balance_mode == 'quota':
+            quotas = self._equal_quotas(fair_columns, num_samples)
+            if quotas is not None:
+                return self.sample_quotas(quotas, rng=rng)
+            return self.model.sample(num_samples)  # No usable condition: draw unbalanced
         
-        # Generate synthetic data
         synthetic_data = self.model.sample(num_samples)
         
         # Apply fairness constraints by balancing protected attributes
-        synthetic_data = self._balance_protected_attributes(synthetic_data, fair_columns)
+        if fair_columns:
+            synthetic_data = self._balance_protected_attributes(synthetic_data, fair_columns, rng=rng)
         
         return synthetic_data
     
-    def _balance_protected_attributes(self, data, protected_columns):
-        """Balance protected attributes in the synthetic data"""
-        balanced_data = data.copy()
+    def iter_samples(self, num_samples, batch_size=100000, fair_columns=None, seed=None):
+        """Yield ``num_samples`` synthetic rows as balanced batches of at most ``batch_size``.
+        
+        Each batch is drawn and balanced on its own, so memory stays bounded
+        by the batch size however many rows are requested. The ``over`` and
+        ``under`` modes resize a batch while balancing it; the balanced,
+        shuffled rows are cut to the rows still owed and drawing continues
+        until ``num_samples`` rows are produced. ``seed`` overrides
+        ``random_state`` for balancing.
+        """
+        if self.model is None:
+            raise RuntimeError("FairDataGenerator must be fitted before sampling")
         
+        rng = np.random.default_rng(self.random_state if seed is None else seed)
+        remaining = num_samples
+        while remaining > 0:
+            n = min(batch_size, remaining)
+            batch = self._draw(n, fair_columns, rng)
+            if batch.empty:
+                logger.warning(f"Sampling stopped {remaining} rows short: a batch came back empty")
+                return
+            if len(batch) > n:
+                batch = batch.iloc[:n]
+            remaining -= len(batch)
+            yield batch
+    
+    def sample_to_files(self, num_samples, output_dir, batch_size=100000, fair_columns=None,
+                        file_format='parquet', partition_cols=None):
+        """Stream ``num_samples`` synthetic rows to ``output_dir`` one batch at a time.
+        
+        Each batch becomes ``part-NNNNN.parquet`` (or ``.csv``), or is split
+        into Hive-style ``partition_cols`` directories such as
+        ``location=Rural/``. Parquet files share the first batch's schema.
+        """
+        n_rows, n_batches = self._write_batches(self.iter_samples(num_samples, batch_size, fair_columns),
+                                                output_dir, file_format, partition_cols)
+        return {'rows': n_rows, 'batches': n_batches, 'output_dir': output_dir}
+    
+    def sample_parallel(self, num_samples, max_workers=None, batch_size=100000, fair_columns=None,
+                        output_dir=None, file_format='parquet', partition_cols=None):
+        """Split a large sampling request into one shard per worker process.
+        
+        The fitted generator is saved once and loaded once in each worker.
+        Every shard gets an independent seed from
+        ``SeedSequence(random_state).spawn``, so a given ``random_state`` and
+        worker count always reproduce the same rows. Returns the shards
+        concatenated in order, or with ``output_dir`` writes
+        ``shard-KKK-part-NNNNN`` files and returns a summary.
+        """
+        if self.model is None:
+            raise RuntimeError("FairDataGenerator must be fitted before sampling")
+        if file_format not in ('parquet', 'csv'):
+            raise ValueError(f"Unsupported file format: {file_format}")
+        
+        n_shards = max(1, min(max_workers or os.cpu_count() or 1, num_samples))
+        base, extra = divmod(num_samples, n_shards)
+        sizes = [base + (shard < extra) for shard in range(n_shards)]
+        seeds = np.random.SeedSequence(self.random_state).spawn(n_shards)
+        tasks = [(shard, size, seed, batch_size, fair_columns, output_dir, file_format, partition_cols)
+                 for shard, (size, seed) in enumerate(zip(sizes, seeds))]
+        
+        if n_shards == 1:
+            # Sampling in-process reseeds the global RNGs; hand the caller's state back afterwards
+            torch = sys.modules.get('torch')
+            numpy_state = np.random.get_state()
+            torch_state = torch.get_rng_state() if torch is not None else None
+            try:
+                results = [self._sample_shard(*task) for task in tasks]
+            finally:
+                np.random.set_state(numpy_state)
+                if torch_state is not None:
+                    torch.set_rng_state(torch_state)
+        else:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                path = os.path.join(tmp_dir, 'generator.pkl')
+                self.save(path)
+                with ProcessPoolExecutor(max_workers=n_shards, initializer=_load_worker_generator,
+                                         initargs=(path,)) as executor:
+                    results = list(executor.map(_sample_shard, *zip(*tasks)))
+        
+        if output_dir is None:
+            return pd.concat(results, ignore_index=True)
+        return {'rows': sum(rows for rows, _ in results), 'batches': sum(batches for _, batches in results),
+                'shards': n_shards, 'output_dir': output_dir}
+    
+    def _sample_shard(self, shard, num_samples, seed, batch_size, fair_columns, output_dir, file_format,
+                      partition_cols):
+        """Seed every RNG the synthesizer draws from, then sample one shard"""
+        np.random.seed(seed.generate_state(1)[0])
+        torch = sys.modules.get('torch')  # Loaded with the CTGAN model
+        if torch is not None:
+            torch.manual_seed(int(seed.generate_state(1, dtype=np.uint64)[0]) >> 1)
+        
+        batches = self.iter_samples(num_samples, batch_size, fair_columns, seed=seed)
+        if output_dir is None:
+            batches = list(batches)
+            return pd.concat(batches, ignore_index=True) if batches else self._empty_sample()
+        return self._write_batches(batches, output_dir, file_format, partition_cols, prefix=f"shard-{shard:03d}-part")
+    
+    def _write_batches(self, batches, output_dir, file_format, partition_cols, prefix='part'):
+        """Write batches as they arrive; returns ``(rows, batches)`` written"""
+        if file_format not in ('parquet', 'csv'):
+            raise ValueError(f"Unsupported file format: {file_format}")
+        os.makedirs(output_dir, exist_ok=True)
+        
+        schema, n_rows, n_batches = None, 0, 0
+        for i, batch in enumerate(batches):
+            name = f"{prefix}-{i:05d}"
+            if file_format == 'parquet':
+                schema = self._write_parquet_batch(batch, output_dir, name, schema, partition_cols)
+            else:
+                self._write_csv_batch(batch, output_dir, name, partition_cols)
+            n_rows += len(batch)
+            n_batches += 1
+        return n_rows, n_batches
+    
+    def _write_parquet_batch(self, batch, output_dir, name, schema, partition_cols):
+        """Write one batch as Parquet pinned to ``schema``; returns the schema in use"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        table = pa.Table.from_pandas(batch, preserve_index=False)
+        schema = table.schema if schema is None else schema
+        table = table.cast(schema)
+        if partition_cols:
+            pq.write_to_dataset(table, output_dir, partition_cols=partition_cols,
+                                basename_template=f"{name}-{{i}}.parquet")
+        else:
+            pq.write_table(table, os.path.join(output_dir, f"{name}.parquet"))
+        return schema
+    
+    def _write_csv_batch(self, batch, output_dir, name, partition_cols):
+        """Write one batch as CSV, split into ``col=value`` directories when partitioned"""
+        if not partition_cols:
+            batch.to_csv(os.path.join(output_dir, f"{name}.csv"), index=False)
+            return
+        for keys, group in batch.groupby(partition_cols, sort=False):
+            keys = keys if isinstance(keys, tuple) else (keys,)
+            partition_dir = os.path.join(output_dir, *[f"{col}={key}" for col, key in zip(partition_cols, keys)])
+            os.makedirs(partition_dir, exist_ok=True)
+            group.drop(columns=partition_cols).to_csv(os.path.join(partition_dir, f"{name}.csv"), index=False)
+    
+    def save(self, path):
+        """Save the trained model and its settings so it can be sampled without retraining"""
+        if self.model is None:
+            raise RuntimeError("FairDataGenerator must be fitted before saving")
+        state = {
+            'version': self.ARTIFACT_VERSION,
+            'params': self._training_params(),
+            'model_key': self.model_key,
+            'random_state': self.random_state,
+            'balance_mode': self.balance_mode,
+            'category_values': self.category_values,
+            'backend': self.backend,
+            'model': self.model
+        }
+        with open(path, 'wb') as fh:
+            pickle.dump(state, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    
+    @classmethod
+    def load(cls, path, cache=None):
+        """Restore a generator written by ``save``"""
+        with open(path, 'rb') as fh:
+            state = pickle.load(fh)
+        params = dict(state['params'])
+        backend = state.get('backend')
+        if backend is None:  # Artifacts written before the backend was stored
+            backend = cls.BACKENDS[params.pop('model')](**params)
+        generator = cls(epochs=params.get('epochs', 100), batch_size=params.get('batch_size', 500), cache=cache,
+                        random_state=state.get('random_state'), balance_mode=state.get('balance_mode', 'fixed'),
+                        backend=backend)
+        generator.model = state['model']
+        generator.model_key = state['model_key']
+        generator.category_values = state.get('category_values', {})
+        return generator
+    
+    def _training_params(self):
+        """Hyperparameters that change the trained model, part of its cache key"""
+        return self.backend.params()
+    
+    def _train(self, original_data):
+        """Fit a new model with the configured backend"""
+        return self.backend.train(original_data)
+    
+    def _balance_protected_attributes(self, data, protected_columns, size=None, rng=None):
+        """Balance the joint cells of the protected attributes (e.g. location x gender).
+        
+        Rows are grouped by their combination of protected values and every
+        cell gets the same target count, computed once: the largest cell's
+        count in ``over`` mode, the smallest in ``under`` mode, or an even
+        split of ``size`` (default: the input size) in ``fixed`` mode. Cells
+        keep distinct rows up to the target and draw with replacement beyond
+        it; the result is built with one shuffled ``take`` over row indices.
+        """
+        protected_columns = [column for column in protected_columns if column in data.columns]
+        if not protected_columns or data.empty:
+            return data
+        rng = rng if rng is not None else np.random.default_rng(42)
+        
+        # Joint cell of every row, missing values forming their own cell
+        cell_codes = np.zeros(len(data), dtype=np.int64)
         for column in protected_columns:
-            if column in balanced_data.columns:
-                # Get value counts and find target distribution
-                value_counts = balanced_data[column].value_counts()
-                target_count = value_counts.max()  # Aim for equal representation
-                
-                # Resample to balance
-                balanced_samples = []
-                for value in value_counts.index:
-                    value_data = balanced_data[balanced_data[column] == value]
-                    # Oversample underrepresented groups
-                    if len(value_data) < target_count:
-                        additional_needed = target_count - len(value_data)
-                        additional_samples = value_data.sample(
-                            n=additional_needed, 
-                            replace=True,  # Allow sampling with replacement
-                            random_state=42
-                        )
-                        balanced_samples.append(pd.concat([value_data, additional_samples]))
-                    else:
-                        balanced_samples.append(value_data)
-                
-                # Combine and shuffle
-                balanced_data = pd.concat(balanced_samples, ignore_index=True)
-                balanced_data = balanced_data.sample(frac=1, random_state=42).reset_index(drop=True)
-        
-        return balanced_data
+            codes, uniques = pd.factorize(data[column], use_na_sentinel=False)
+            cell_codes = cell_codes * len(uniques) + codes
+        _, cells = np.unique(cell_codes, return_inverse=True)
+        counts = np.bincount(cells)
+        n_cells = len(counts)
+        
+        if self.balance_mode == 'over':
+            targets = np.full(n_cells, counts.max())
+        elif self.balance_mode == 'under':
+            targets = np.full(n_cells, counts.min())
+        else:
+            size = len(data) if size is None else size
+            targets = np.full(n_cells, size // n_cells)
+            targets[rng.permutation(n_cells)[:size % n_cells]] += 1  # Spread the remainder at random
+        
+        # Rows of each cell in random order, cells laid out one after another
+        order = rng.permutation(len(data))
+        order = order[np.argsort(cells[order], kind='stable')]
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        
+        # Offsets within each cell: distinct rows first, then draws with replacement
+        offsets = np.arange(targets.sum()) - np.repeat(np.cumsum(targets) - targets, targets)
+        cell_of_slot = np.repeat(np.arange(n_cells), targets)
+        extra = offsets >= counts[cell_of_slot]
+        offsets[extra] = (rng.random(extra.sum()) * counts[cell_of_slot[extra]]).astype(np.int64)
+        
+        index = order[starts[cell_of_slot] + offsets]
+        return data.take(rng.permutation(index)).reset_index(drop=True)
     
     def validate_synthetic_data(self, original_data, synthetic_data, target_column='loan_approved'):
         """Validate the quality and fairness of synthetic data"""
@@ -2,7 +2,10 @@
 Synthetic data generation modules using GANs and other generative models
 """
 
+from .backends import CTGANBackend, GaussianCopulaBackend, GaussianCopulaModel
 from .fair_gan import FairDataGenerator
 from .data_validator import DataValidator
+from .model_cache import ModelCache
 
-__all__ = ["FairDataGenerator", "DataValidator"]
+__all__ = ["FairDataGenerator", "DataValidator", "ModelCache", "CTGANBackend", "GaussianCopulaBackend",
+           "GaussianCopulaModel"]
@@ -0,0 +1,36 @@
+import hashlib
+import json
+
+import pandas as pd
+
+try:  # Imported as src.synthetic_generator, e.g. by the demo app
+    from ..data_processing.two_tier_cache import TwoTierCache
+except ImportError:  # src/ on the path or installed: the packages are top level
+    from data_processing.two_tier_cache import TwoTierCache
+
+
+class ModelCache(TwoTierCache):
+    """Content-addressed cache for trained synthesizers.
+
+    Models are keyed by a fingerprint of the training frame together with
+    the hyperparameters that shape training, so a generator fitted on the
+    same data with the same settings is reused instead of retrained. A
+    small in-memory LRU holds live models; with ``cache_dir`` set they are
+    also pickled to disk, where batch jobs and later processes find them,
+    and the least recently used files are evicted once the directory grows
+    past ``max_disk_bytes``.
+    """
+
+    def __init__(self, max_entries=4, cache_dir=None, max_disk_bytes=2 * 1024 ** 3):
+        super().__init__(max_entries, cache_dir, max_disk_bytes)
+
+    @staticmethod
+    def fingerprint(data, params):
+        """Fingerprint of a training frame's schema and content plus hyperparameters"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        digest.update(repr(len(data)).encode())
+        for col in data.columns:
+            digest.update(f"{col}:{data[col].dtype}".encode())
+            digest.update(pd.util.hash_pandas_object(data[col], index=False).to_numpy().tobytes())
+        return digest.hexdigest()
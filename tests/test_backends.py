@@ -0,0 +1,151 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from synthetic_generator.backends import GaussianCopulaBackend
+from synthetic_generator.fair_gan import FairDataGenerator
+
+class BootstrapBackend:
+    """Custom backend that resamples training rows"""
+    
+    name = 'bootstrap'
+    
+    def params(self):
+        return {'model': self.name}
+    
+    def train(self, data):
+        return BootstrapModel(data)
+
+
+class BootstrapModel:
+    def __init__(self, data):
+        self.data = data.reset_index(drop=True)
+    
+    def sample(self, num_rows):
+        return self.data.take(np.random.randint(0, len(self.data), num_rows)).reset_index(drop=True)
+
+class TestGaussianCopulaBackend(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up mixed-type applicant data with correlated columns"""
+        rng = np.random.default_rng(42)
+        n = 20000
+        income = rng.lognormal(10.5, 0.5, n)
+        self.data = pd.DataFrame({
+            'age': rng.integers(20, 60, n),
+            'location': rng.choice(['Nairobi', 'Kisumu', 'Mombasa'], n, p=[0.5, 0.3, 0.2]),
+            'gender': rng.choice(['Male', 'Female'], n),
+            'income': income,
+            'loan_amount': np.where(rng.random(n) < 0.05, np.nan, income * rng.uniform(0.5, 1.5, n)),
+            'loan_approved': (rng.random(n) < 0.6).astype(int)
+        })
+        self.generator = FairDataGenerator(backend='copula', random_state=0)
+    
+    def test_sample_keeps_schema_and_marginals(self):
+        """Test that samples keep dtypes, categories, missing rates and quantiles"""
+        np.random.seed(0)
+        synthetic = self.generator.fit(self.data).sample(20000)
+        
+        self.assertEqual(list(synthetic.columns), list(self.data.columns))
+        self.assertEqual(synthetic.dtypes.to_dict(), self.data.dtypes.to_dict())
+        self.assertEqual(set(synthetic['location']), set(self.data['location']))
+        self.assertAlmostEqual(synthetic['loan_amount'].isna().mean(), 0.05, delta=0.01)
+        self.assertAlmostEqual((synthetic['location'] == 'Nairobi').mean(), 0.5, delta=0.02)
+        self.assertAlmostEqual(synthetic['loan_approved'].mean(), self.data['loan_approved'].mean(), delta=0.02)
+        for q in (0.1, 0.5, 0.9):
+            self.assertAlmostEqual(synthetic['income'].quantile(q) / self.data['income'].quantile(q), 1, delta=0.05)
+        self.assertTrue(synthetic['age'].between(20, 59).all())
+    
+    def test_sample_keeps_correlation(self):
+        """Test that the dependence between numeric columns survives"""
+        np.random.seed(0)
+        synthetic = self.generator.fit(self.data).sample(20000)
+        
+        expected = self.data[['income', 'loan_amount']].corr(method='spearman').iloc[0, 1]
+        observed = synthetic[['income', 'loan_amount']].corr(method='spearman').iloc[0, 1]
+        self.assertAlmostEqual(observed, expected, delta=0.05)
+    
+    def test_backend_selection_and_round_trip(self):
+        """Test backend lookup, its cache key and save/load of a copula generator"""
+        self.assertEqual(FairDataGenerator().backend.name, 'ctgan')
+        self.assertEqual(self.generator._training_params()['model'], 'copula')
+        self.assertNotEqual(FairDataGenerator(backend=GaussianCopulaBackend(n_quantiles=10))._training_params(),
+                            self.generator._training_params())
+        with self.assertRaises(ValueError):
+            FairDataGenerator(backend='vae')
+        
+        self.generator.fit(self.data)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'generator.pkl')
+            self.generator.save(path)
+            restored = FairDataGenerator.load(path)
+        self.assertEqual(restored._training_params(), self.generator._training_params())
+        np.random.seed(1)
+        expected = self.generator.sample(100, ['location', 'gender'])
+        np.random.seed(1)
+        pd.testing.assert_frame_equal(restored.sample(100, ['location', 'gender']), expected)
+    
+    def test_custom_backend_round_trip(self):
+        """Test that a generator with an unregistered backend object survives save/load and worker sampling"""
+        generator = FairDataGenerator(backend=BootstrapBackend(), random_state=0).fit(self.data)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'generator.pkl')
+            generator.save(path)
+            restored = FairDataGenerator.load(path)
+        
+        self.assertIsInstance(restored.backend, BootstrapBackend)
+        self.assertEqual(restored.model_key, generator.model_key)
+        self.assertEqual(len(generator.sample_parallel(100, max_workers=2)), 100)
+    
+    def test_quota_sampling_with_copula(self):
+        """Test that quota sampling works through rejection on the copula model"""
+        quotas = pd.DataFrame({'gender': ['Male', 'Female'], 'num_rows': [300, 200]})
+        result = self.generator.fit(self.data).sample_quotas(quotas)
+        
+        self.assertEqual(result['gender'].value_counts().to_dict(), {'Male': 300, 'Female': 200})
+    
+    def test_single_shard_keeps_caller_rng_state(self):
+        """Test that in-process sharded sampling leaves the global NumPy RNG as it found it"""
+        self.generator.fit(self.data)
+        np.random.seed(3)
+        expected = np.random.random(5)
+        
+        np.random.seed(3)
+        synthetic = self.generator.sample_parallel(101, max_workers=1, batch_size=40)
+        
+        self.assertEqual(len(synthetic), 101)
+        np.testing.assert_array_equal(np.random.random(5), expected)
+        
+        empty = self.generator.sample_parallel(0)
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(list(empty.columns), list(self.data.columns))
+    
+    def test_quota_mode_without_usable_columns(self):
+        """Test that quota balancing on absent or high-cardinality columns falls back to an unbalanced draw"""
+        generator = FairDataGenerator(balance_mode='quota', backend='copula', random_state=0).fit(self.data)
+        
+        with self.assertLogs('synthetic_generator.fair_gan', level='WARNING') as logs:
+            synthetic = generator.sample(100, ['county', 'income'])
+        
+        self.assertEqual(len(synthetic), 100)
+        self.assertIn("['county', 'income']", logs.output[0])
+    
+    def test_streamed_sampling_keeps_row_count_when_resizing(self):
+        """Test that over and under balancing still stream exactly the requested rows"""
+        for mode in ('over', 'under'):
+            generator = FairDataGenerator(balance_mode=mode, backend='copula', random_state=0).fit(self.data)
+            with tempfile.TemporaryDirectory() as tmp:
+                summary = generator.sample_to_files(1000, tmp, batch_size=300, fair_columns=['location', 'gender'])
+                written = pd.read_parquet(tmp)
+            
+            self.assertEqual(summary['rows'], 1000)
+            self.assertEqual(len(written), 1000)
+
+if __name__ == '__main__':
+    unittest.main()
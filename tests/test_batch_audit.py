@@ -0,0 +1,57 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processing.batch_audit import BatchAuditor
+from data_processing.bias_detector import BiasDetector
+
+class TestBatchAudit(unittest.TestCase):
+    
+    def setUp(self):
+        """Write a few lender extracts to disk"""
+        np.random.seed(42)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.frames = []
+        self.paths = []
+        for i in range(3):
+            df = pd.DataFrame({
+                'location': np.random.choice(['Nairobi', 'Mombasa', 'Rural'], 200),
+                'gender': np.random.choice(['Male', 'Female'], 200),
+                'loan_approved': np.random.choice([0, 1], 200)
+            })
+            path = os.path.join(self.tmp_dir.name, f'extract_{i}.csv')
+            df.to_csv(path, index=False)
+            self.frames.append(df)
+            self.paths.append(path)
+        self.detector = BiasDetector()
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_parallel_audit_matches_serial(self):
+        """Test per-file and pooled reports from a process pool"""
+        finished = []
+        results = BatchAuditor(self.detector, max_workers=2).audit_files(
+            self.paths, on_result=lambda path, report: finished.append(path)
+        )
+        
+        self.assertEqual(sorted(finished), sorted(self.paths))
+        for path, df in zip(self.paths, self.frames):
+            self.assertEqual(results['files'][path], self.detector.analyze_dataset(df))
+        self.assertEqual(results['pooled'], self.detector.analyze_dataset(pd.concat(self.frames)))
+    
+    def test_unreadable_file_is_reported(self):
+        """Test that a failing file yields an error entry without stopping the batch"""
+        missing = os.path.join(self.tmp_dir.name, 'missing.csv')
+        results = BatchAuditor(self.detector, max_workers=1).audit_files(self.paths + [missing])
+        
+        self.assertIn('error', results['files'][missing])
+        self.assertEqual(results['pooled']['dataset_shape'][0], 600)
+
+if __name__ == '__main__':
+    unittest.main()
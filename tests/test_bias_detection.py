@@ -3,11 +3,13 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import tempfile
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from data_processing.bias_detector import BiasDetector
+from data_processing.report_cache import ReportCache
 
 class TestBiasDetection(unittest.TestCase):
     
@@ -35,6 +37,121 @@ class TestBiasDetection(unittest.TestCase):
         self.assertIn('bias_metrics', report)
         self.assertEqual(report['dataset_shape'], self.sample_data.shape)
     
+    def test_analyze_csv_and_record_array(self):
+        """Test that file and record array inputs give the same report as a DataFrame"""
+        data = self.sample_data.assign(business_type=np.random.choice([0, 1], 100))  # Numeric group codes
+        expected = self.detector.analyze_dataset(data)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'applications.csv')
+            data.to_csv(csv_path, index=False)
+            csv_report = self.detector.analyze_dataset(csv_path)
+        
+        records_report = self.detector.analyze_dataset(data.to_records(index=False))
+        
+        for report in (csv_report, records_report):
+            self.assertEqual(report['dataset_shape'], data.shape)
+            self.assertAlmostEqual(report['approval_rate'], expected['approval_rate'])
+            for attr, metrics in expected['bias_metrics'].items():
+                self.assertAlmostEqual(report['bias_metrics'][attr]['disparate_impact'],
+                                       metrics['disparate_impact'])
+                self.assertEqual(report['bias_metrics'][attr]['approval_rates'], metrics['approval_rates'])
+    
+    def test_chunked_csv_matches_in_memory(self):
+        """Test that a chunked CSV audit reproduces the in-memory report"""
+        expected = self.detector.analyze_dataset(self.sample_data)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'applications.csv')
+            self.sample_data.to_csv(csv_path, index=False)
+            report = self.detector.analyze_dataset(csv_path, chunksize=7)
+        
+        self.assertEqual(report, expected)
+    
+    def test_merge_shard_statistics(self):
+        """Test that statistics from separate shards merge into the full report"""
+        shards = [self.sample_data.iloc[:30], self.sample_data.iloc[30:]]
+        stats = [self.detector.accumulate_statistics(shard) for shard in shards]
+        
+        merged = stats[0].merge(stats[1])
+        
+        self.assertEqual(self.detector.report_from_statistics(merged),
+                         self.detector.analyze_dataset(self.sample_data))
+    
+    def test_intersectional_analysis(self):
+        """Test intersectional audit against grouped means and min-support pruning"""
+        report = self.detector.analyze_intersections(self.sample_data, max_order=2, min_support=5)
+        
+        metrics = report['intersections'][('location', 'gender')]
+        grouped = self.sample_data.groupby(['location', 'gender'])['loan_approved'].agg(['size', 'mean'])
+        supported = grouped[grouped['size'] >= 5]
+        
+        self.assertEqual(set(metrics['approval_rates']), set(supported.index))
+        for cell, rate in metrics['approval_rates'].items():
+            self.assertAlmostEqual(rate, supported.loc[cell, 'mean'])
+            self.assertEqual(metrics['group_sizes'][cell], supported.loc[cell, 'size'])
+        
+        with self.assertRaises(ValueError):
+            self.detector.analyze_intersections(self.sample_data, max_order=1)
+    
+    def test_disparate_impact_confidence_interval(self):
+        """Test that bootstrap intervals bracket the ratio and shrink with more data"""
+        detector = BiasDetector(n_bootstrap=2000, random_state=0)
+        metrics = detector._calculate_disparate_impact(self.sample_data, 'gender')
+        
+        lower, upper = metrics['disparate_impact_ci']
+        self.assertLessEqual(lower, metrics['disparate_impact'])
+        self.assertGreaterEqual(upper, metrics['disparate_impact'])
+        
+        small = detector.disparate_impact_interval([50, 50], [40, 20])
+        large = detector.disparate_impact_interval([5000, 5000], [4000, 2000])
+        self.assertLess(large[1] - large[0], small[1] - small[0])
+    
+    def test_reweighing_weights(self):
+        """Test that reweighing weights match P(group) P(label) / P(group, label)"""
+        weights = self.detector.reweighing_weights(self.sample_data, ['location', 'gender'])
+        
+        n = len(self.sample_data)
+        group_p = self.sample_data.groupby(['location', 'gender']).size() / n
+        label_p = self.sample_data['loan_approved'].value_counts() / n
+        cell_p = self.sample_data.groupby(['location', 'gender', 'loan_approved']).size() / n
+        expected = [
+            group_p[(row.location, row.gender)] * label_p[row.loan_approved]
+            / cell_p[(row.location, row.gender, row.loan_approved)]
+            for row in self.sample_data.itertuples()
+        ]
+        
+        self.assertEqual(weights.dtype, np.float32)
+        np.testing.assert_allclose(weights, expected, rtol=1e-6)
+    
+    def test_report_cache(self):
+        """Test that unchanged data is served from the memory and disk tiers"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            detector = BiasDetector(cache=ReportCache(cache_dir=tmp_dir))
+            first = detector.analyze_dataset(self.sample_data)
+            second = detector.analyze_dataset(self.sample_data.copy())
+            self.assertEqual(first, second)
+            self.assertEqual((detector.cache.hits, detector.cache.misses), (1, 1))
+            
+            # A fresh memory tier still finds the report on disk
+            detector.cache = ReportCache(cache_dir=tmp_dir)
+            self.assertEqual(detector.analyze_dataset(self.sample_data), first)
+            self.assertEqual(detector.cache.hits, 1)
+            
+            # Changing the data or the threshold misses
+            changed = self.sample_data.assign(loan_approved=1 - self.sample_data['loan_approved'])
+            detector.analyze_dataset(changed)
+            detector.di_threshold = 0.9
+            detector.analyze_dataset(self.sample_data)
+            self.assertEqual(detector.cache.misses, 2)
+            
+            # Dropping a column outside the audit still changes the reported shape
+            narrow = self.sample_data.drop(columns='age')
+            self.assertEqual(detector.analyze_dataset(narrow)['dataset_shape'], narrow.shape)
+            records = narrow.to_records(index=False)
+            self.assertEqual(detector.analyze_dataset(records)['dataset_shape'], narrow.shape)
+            self.assertEqual(detector.cache.misses, 4)
+    
     def test_disparate_impact_calculation(self):
         """Test disparate impact calculation"""
         # Create intentionally biased data
@@ -48,6 +165,17 @@ class TestBiasDetection(unittest.TestCase):
         self.assertIn('disparate_impact', metrics)
         self.assertIn('is_biased', metrics)
         self.assertTrue(metrics['is_biased'])  # Should detect bias
+    
+    def test_group_statistics_match_group_means(self):
+        """Test vectorized group counts against per-group means"""
+        stats = self.detector._group_statistics(self.sample_data, ['location', 'gender'])
+        
+        for attr in ['location', 'gender']:
+            labels, counts, approvals = stats[attr]
+            expected = self.sample_data.groupby(attr)['loan_approved'].agg(['size', 'mean'])
+            for label, count, approved in zip(labels, counts, approvals):
+                self.assertEqual(count, expected.loc[label, 'size'])
+                self.assertAlmostEqual(approved / count, expected.loc[label, 'mean'])
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processing.bias_detector import BiasDetector
+from data_processing.bias_monitor import BiasMonitor
+
+class TestBiasMonitor(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a stream of decisions"""
+        np.random.seed(42)
+        self.events = pd.DataFrame({
+            'location': np.random.choice(['Nairobi', 'Rural'], 500),
+            'gender': np.random.choice(['Male', 'Female'], 500),
+            'loan_approved': np.random.choice([0, 1], 500)
+        })
+        self.detector = BiasDetector()
+    
+    def test_count_window_matches_batch_analysis(self):
+        """Test that a count-based window reports the metrics of its last events"""
+        monitor = BiasMonitor(self.detector, window_size=200, min_group_size=0)
+        monitor.update_batch(self.events)
+        
+        expected = self.detector.analyze_dataset(self.events.tail(200))
+        metrics = monitor.current_metrics()
+        
+        self.assertEqual(len(monitor), 200)
+        for attr in ['location', 'gender']:
+            self.assertAlmostEqual(metrics[attr]['disparate_impact'],
+                                   expected['bias_metrics'][attr]['disparate_impact'])
+    
+    def test_time_window_expires_old_events(self):
+        """Test that a time-based window only keeps recent events"""
+        monitor = BiasMonitor(self.detector, window_seconds=10, min_group_size=0)
+        monitor.update_batch(self.events, timestamps=np.arange(len(self.events), dtype=float))
+        
+        self.assertEqual(len(monitor), 10)
+    
+    def test_alert_when_window_becomes_biased(self):
+        """Test that an alert is raised once when disparate impact drops"""
+        alerts = []
+        monitor = BiasMonitor(self.detector, window_size=100, min_group_size=10, on_alert=alerts.append)
+        
+        for i in range(200):
+            gender = 'Male' if i % 2 else 'Female'
+            approved = 1 if gender == 'Male' or i < 100 else 0
+            monitor.update({'gender': gender, 'loan_approved': approved})
+        
+        self.assertEqual(len(alerts), 1)
+        self.assertEqual(alerts[0]['attribute'], 'gender')
+        self.assertLess(alerts[0]['disparate_impact'], self.detector.di_threshold)
+    
+    def test_window_skips_bootstrap_intervals(self):
+        """Test that a bootstrapping detector does not run its bootstrap on every event"""
+        detector = BiasDetector(n_bootstrap=1000, random_state=0)
+        monitor = BiasMonitor(detector, window_size=200, min_group_size=0)
+        rng_state = detector.rng.bit_generator.state
+        
+        monitor.update_batch(self.events)
+        
+        self.assertEqual(detector.rng.bit_generator.state, rng_state)
+        self.assertNotIn('disparate_impact_ci', monitor.current_metrics()['gender'])
+
+if __name__ == '__main__':
+    unittest.main()
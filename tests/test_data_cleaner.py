@@ -0,0 +1,232 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processing.chunked_source import ChunkedSource
+from data_processing.data_cleaner import DataCleaner
+
+class TestDataCleaner(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up raw credit applications with gaps"""
+        np.random.seed(42)
+        n = 200
+        self.raw_data = pd.DataFrame({
+            'age': np.random.randint(18, 70, n).astype(float),
+            'location': np.random.choice(['Nairobi', 'Mombasa', 'Kisumu', None], n),
+            'gender': np.random.choice(['Male', 'Female'], n),
+            'business_type': np.random.choice(['Retail', 'Agriculture', 'Transport'], n),
+            'mpesa_transaction_count': np.random.poisson(40, n).astype(float),
+            'loan_amount': np.random.uniform(1000, 100000, n),
+            'income': np.random.uniform(5000, 80000, n),
+            'loan_approved': np.random.choice([0, 1], n)
+        })
+        self.raw_data.loc[::7, 'age'] = np.nan
+        self.raw_data.loc[::11, 'income'] = np.nan
+        self.cleaner = DataCleaner()
+    
+    def test_transform_uses_fitted_codes(self):
+        """Test that scoring batches reuse training codes and flag unseen categories"""
+        self.cleaner.fit(self.raw_data)
+        batch = pd.DataFrame({
+            'location': ['Nairobi', 'Garissa', None],
+            'gender': ['Female', 'Male', 'Female'],
+            'business_type': ['Transport', 'Retail', 'Retail']
+        })
+        
+        cleaned = self.cleaner.transform(batch)
+        
+        location_codes = self.cleaner.vocabularies['location']
+        self.assertEqual(cleaned['location'].iloc[0], location_codes.index('Nairobi'))
+        self.assertEqual(cleaned['location'].iloc[1], DataCleaner.UNKNOWN_CODE)
+        self.assertEqual(cleaned['location'].iloc[2], location_codes.index(self.cleaner.modes['location']))
+        self.assertEqual(cleaned['gender'].tolist(), [0, 1, 0])
+    
+    def test_clean_credit_data_matches_label_encoding(self):
+        """Test that batch cleaning imputes and encodes like sorted label encoding"""
+        cleaned = self.cleaner.clean_credit_data(self.raw_data)
+        
+        self.assertFalse(cleaned[['age', 'income', 'location']].isnull().any().any())
+        filled = self.raw_data['location'].fillna(self.raw_data['location'].mode()[0])
+        expected_codes = pd.Series(pd.factorize(filled, sort=True)[0])
+        self.assertTrue((cleaned['location'] == expected_codes).all())
+        self.assertIn('financial_activity_score', cleaned.columns)
+        self.assertIn('age_group', cleaned.columns)
+    
+    def test_category_and_bool_columns_are_encoded(self):
+        """Test that categorical columns stored as category or bool dtype fit and encode like strings"""
+        data = self.raw_data.astype({'gender': 'category'})
+        data['business_type'] = data['business_type'] == 'Retail'
+        data.loc[::5, 'gender'] = np.nan
+        
+        cleaned = self.cleaner.clean_credit_data(data)
+        
+        self.assertEqual(self.cleaner.vocabularies['gender'], ['Female', 'Male'])
+        self.assertEqual(self.cleaner.vocabularies['business_type'], ['False', 'True'])
+        expected = data['gender'].map({'Female': 0, 'Male': 1}).astype(float).fillna(DataCleaner.UNKNOWN_CODE)
+        self.assertEqual(cleaned['gender'].tolist(), expected.astype(int).tolist())
+        self.assertEqual(cleaned['business_type'].tolist(), data['business_type'].astype(int).tolist())
+    
+    def test_fused_plan_converts_and_bins_like_pandas(self):
+        """Test that the fused plan coerces numeric strings and bins ages like pd.cut"""
+        self.cleaner.fit(self.raw_data)
+        batch = self.raw_data.head(6).astype({'age': object})
+        batch.loc[[1, 3, 5], 'age'] = ['17', 'unknown', None]
+        
+        cleaned = self.cleaner.transform(batch)
+        
+        expected_age = pd.to_numeric(batch['age'].fillna(self.cleaner.medians['age']), errors='coerce')
+        pd.testing.assert_series_equal(cleaned['age'], expected_age.astype(np.float64))
+        expected_groups = pd.cut(expected_age, bins=DataCleaner.AGE_BINS, labels=DataCleaner.AGE_LABELS)
+        pd.testing.assert_series_equal(cleaned['age_group'], expected_groups, check_names=False)
+        self.assertTrue(np.isnan(cleaned['age'].iloc[3]))
+    
+    def test_save_and_load_round_trip(self):
+        """Test that a saved artifact reproduces the fitted transform"""
+        self.cleaner.fit(self.raw_data)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'cleaner.json')
+            self.cleaner.save(path)
+            restored = DataCleaner.load(path)
+        
+        pd.testing.assert_frame_equal(restored.transform(self.raw_data), self.cleaner.transform(self.raw_data))
+    
+    def test_compact_dtypes(self):
+        """Test that compact mode shrinks dtypes without changing values"""
+        data = self.raw_data.assign(sacco_member=np.random.choice([0, 1], len(self.raw_data)))
+        expected = DataCleaner().clean_credit_data(data)
+        cleaner = DataCleaner(compact_dtypes=True)
+        
+        compacted = cleaner.clean_credit_data(data)
+        
+        for col in ['location', 'gender', 'business_type', 'sacco_member', 'loan_approved']:
+            self.assertEqual(compacted[col].dtype, np.int8)
+        self.assertIsInstance(compacted['age_group'].dtype, pd.CategoricalDtype)
+        pd.testing.assert_frame_equal(compacted.astype({col: expected[col].dtype for col in expected}),
+                                      expected)
+        report = cleaner.memory_report
+        self.assertLess(report['bytes_after'].sum(), report['bytes_before'].sum())
+    
+    def test_out_of_core_parquet_matches_in_memory(self):
+        """Test that two-pass chunked cleaning reproduces the in-memory result"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'applications.csv')
+            self.raw_data.to_csv(csv_path, index=False)
+            summary = self.cleaner.clean_csv_to_parquet(csv_path, os.path.join(tmp_dir, 'cleaned'),
+                                                        chunksize=30)
+            streamed = pd.read_parquet(os.path.join(tmp_dir, 'cleaned'))
+            
+            raw = pd.read_csv(csv_path, dtype={col: str for col in DataCleaner.CATEGORICAL_COLUMNS})
+            expected = DataCleaner().clean_credit_data(raw)
+        
+        self.assertEqual(summary['chunks'], 7)
+        pd.testing.assert_frame_equal(streamed, expected, check_dtype=False, check_categorical=False)
+    
+    def test_chunked_sources_read_alike(self):
+        """Test that frame, CSV and Parquet sources yield the same projected, categorized chunks"""
+        columns = ['location', 'gender', 'income']
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'applications.csv')
+            parquet_path = os.path.join(tmp_dir, 'applications.parquet')
+            self.raw_data.to_csv(csv_path, index=False)
+            self.raw_data.to_parquet(parquet_path, index=False)
+            
+            frames = {}
+            for source in (self.raw_data, csv_path, parquet_path):
+                reader = ChunkedSource(source, columns, categorical=['location', 'gender'])
+                chunks = list(reader.chunks(64))
+                self.assertEqual([len(chunk) for chunk in chunks], [64, 64, 64, 8])
+                self.assertEqual(reader.n_columns, self.raw_data.shape[1])
+                frames[reader.format] = pd.concat(chunks, ignore_index=True)
+        
+        for source_format in ('csv', 'parquet'):
+            pd.testing.assert_frame_equal(frames[source_format], frames['frame'], check_categorical=False)
+        self.assertEqual(frames['csv']['gender'].dtype, 'category')
+    
+    def test_parallel_partitions_match_single_process(self):
+        """Test that pooled partition cleaning encodes exactly like one pass over all rows"""
+        partitions = [group.reset_index(drop=True)
+                      for _, group in self.raw_data.groupby('location', dropna=False, sort=False)]
+        expected = DataCleaner().clean_credit_data(pd.concat(partitions, ignore_index=True))
+        
+        cleaned = self.cleaner.clean_partitions(partitions, max_workers=2)
+        
+        pd.testing.assert_frame_equal(pd.concat(cleaned, ignore_index=True), expected)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            summary = DataCleaner().clean_partitions(partitions, output_dir=tmp_dir, max_workers=2)
+            written = pd.concat([pd.read_parquet(os.path.join(tmp_dir, name))
+                                 for name in sorted(os.listdir(tmp_dir))], ignore_index=True)
+        
+        self.assertEqual(summary['rows'], len(self.raw_data))
+        pd.testing.assert_frame_equal(written, expected, check_dtype=False, check_categorical=False)
+    
+    def test_parallel_partitions_exact_above_sketch_limit(self):
+        """Test that partition medians stay exact once the data outgrows the exact sketch regime"""
+        rng = np.random.default_rng(0)
+        n = DataCleaner.SKETCH_EXACT_LIMIT + 20000
+        data = pd.DataFrame({
+            'age': rng.normal(44, 12, n).round(2),
+            'location': rng.choice(['Nairobi', 'Mombasa', 'Kisumu'], n),
+            'income': rng.lognormal(10, 0.7, n)
+        })
+        data.loc[::9, 'age'] = np.nan
+        partitions = [data.iloc[start:start + n // 4] for start in range(0, n, n // 4)]
+        single = DataCleaner()
+        expected = single.clean_credit_data(data)
+        
+        cleaned = self.cleaner.clean_partitions(partitions, max_workers=2)
+        
+        self.assertEqual(self.cleaner.medians, single.medians)
+        pd.testing.assert_frame_equal(pd.concat(cleaned), expected)
+    
+    def test_approximate_summary_matches_exact(self):
+        """Test that the streamed sketch summary agrees with the in-memory summary"""
+        exact = self.cleaner.get_data_summary(self.raw_data)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            csv_path = os.path.join(tmp_dir, 'applications.csv')
+            self.raw_data.to_csv(csv_path, index=False)
+            streamed = self.cleaner.get_data_summary(csv_path, approximate=True, chunksize=30)
+        partitions = [self.raw_data.iloc[start:start + 70] for start in range(0, len(self.raw_data), 70)]
+        partitioned = self.cleaner.get_data_summary(partitions, approximate=True, max_workers=2)
+        
+        for summary in (streamed, partitioned):
+            self.assertEqual(summary['shape'], exact['shape'])
+            self.assertEqual(summary['missing_values'], exact['missing_values'])
+            self.assertEqual(summary['distinct_counts']['location'], 3)
+            for col, stats in exact['basic_stats'].items():
+                for stat in ('count', 'mean', 'std', 'min', 'max'):
+                    self.assertAlmostEqual(summary['basic_stats'][col][stat], stats[stat], places=6)
+                self.assertAlmostEqual(summary['basic_stats'][col]['50%'], stats['50%'], delta=stats['std'] * 0.1)
+    
+    def test_transform_record_matches_batch(self):
+        """Test that the single-applicant path reproduces the batch features, also across threads"""
+        self.cleaner.fit(self.raw_data)
+        records = self.raw_data.to_dict('records')
+        records[0]['location'] = 'Garissa'
+        records[1]['age'] = 'unknown'
+        del records[2]['income']
+        expected = self.cleaner.to_feature_array(self.cleaner.transform(pd.DataFrame(records)))
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            features = np.array(list(executor.map(self.cleaner.transform_record, records)))
+        
+        np.testing.assert_array_equal(features, expected)
+        self.assertEqual(features[0, self.cleaner.feature_names.index('location')], DataCleaner.UNKNOWN_CODE)
+        self.assertNotIn('loan_approved', self.cleaner.feature_names)
+    
+    def test_transform_requires_fit(self):
+        """Test that transform refuses to run on an unfitted cleaner"""
+        with self.assertRaises(RuntimeError):
+            self.cleaner.transform(self.raw_data)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import json
+import subprocess
+import sys
+import os
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+
+# Compute modules that batch jobs and the CLI import just to get DI numbers
+COMPUTE_MODULES = [
+    'data_processing.bias_detector',
+    'data_processing.bias_monitor',
+    'data_processing.batch_audit',
+    'data_processing.data_cleaner',
+    'synthetic_generator.fair_gan',
+    'synthetic_generator.data_validator',
+]
+# Backends that must only be loaded on first use
+HEAVY_MODULES = ['aif360', 'matplotlib', 'seaborn', 'torch', 'sdv', 'ctgan', 'sklearn', 'scipy']
+# Wall-clock budget for a cold import in a fresh interpreter (pandas dominates)
+IMPORT_BUDGET_SECONDS = 2.0
+
+IMPORT_PROBE = """
+import json, sys, time
+sys.path.insert(0, {src!r})
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+heavy = sorted(name for name in {heavy!r} if name in sys.modules)
+print(json.dumps({{'seconds': elapsed, 'heavy': heavy}}))
+"""
+
+def measure_import(module):
+    """Import ``module`` in a fresh interpreter; return seconds and heavy modules loaded"""
+    probe = IMPORT_PROBE.format(src=SRC_DIR, module=module, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+class TestImportTime(unittest.TestCase):
+    
+    def test_compute_modules_skip_heavy_backends(self):
+        """Test that compute modules import without plotting, GAN or aif360 stacks"""
+        for module in COMPUTE_MODULES:
+            with self.subTest(module=module):
+                self.assertEqual(measure_import(module)['heavy'], [])
+    
+    def test_modules_import_from_repo_root(self):
+        """Test that the ``src.`` import style used by the demo app resolves every compute module"""
+        for module in COMPUTE_MODULES:
+            with self.subTest(module=module):
+                subprocess.run([sys.executable, '-c', f"import src.{module}"], cwd=ROOT_DIR,
+                               capture_output=True, text=True, check=True)
+    
+    def test_import_within_budget(self):
+        """Test that importing the bias detector stays within the startup budget"""
+        seconds = min(measure_import('data_processing.bias_detector')['seconds'] for _ in range(3))
+        self.assertLess(seconds, IMPORT_BUDGET_SECONDS)
+
+if __name__ == '__main__':
+    for module in COMPUTE_MODULES:
+        result = measure_import(module)
+        print(f"{module:40s} {result['seconds'] * 1000:8.1f} ms  heavy={result['heavy']}")
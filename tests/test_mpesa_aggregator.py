@@ -0,0 +1,82 @@
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processing.data_cleaner import DataCleaner
+from data_processing.mpesa_aggregator import MpesaAggregator
+
+class TestMpesaAggregator(unittest.TestCase):
+    
+    def setUp(self):
+        """Set up a raw M-Pesa statement log for a few hundred applicants"""
+        rng = np.random.default_rng(42)
+        n = 20000
+        self.log = pd.DataFrame({
+            'applicant_id': [f'APP_{i:05d}' for i in rng.integers(1, 301, n)],
+            'timestamp': pd.Timestamp('2026-03-01') + pd.to_timedelta(rng.integers(0, 90 * 86400, n), unit='s'),
+            'amount': np.round(rng.lognormal(7, 1.2, n)) * np.where(rng.random(n) < 0.4, 1, -1)
+        })
+    
+    def test_streamed_features_match_groupby(self):
+        """Test that chunked aggregation reproduces per-applicant pandas aggregates"""
+        features = MpesaAggregator().aggregate(self.log, chunksize=3000).features().set_index('applicant_id')
+        
+        log = self.log.assign(size=self.log['amount'].abs(), day=self.log['timestamp'].dt.floor('D'))
+        grouped = log.groupby('applicant_id')
+        features = features.loc[grouped.size().index]
+        inflow = log['amount'].clip(lower=0).groupby(log['applicant_id']).sum()
+        outflow = (-log['amount']).clip(lower=0).groupby(log['applicant_id']).sum()
+        recency = (log['timestamp'].max() - grouped['timestamp'].max()).dt.total_seconds() / 86400
+        
+        np.testing.assert_array_equal(features['mpesa_transaction_count'], grouped.size())
+        np.testing.assert_allclose(features['mpesa_avg_transaction'], grouped['size'].mean())
+        np.testing.assert_allclose(features['mpesa_inflow_outflow_ratio'], inflow / (outflow + 1))
+        np.testing.assert_array_equal(features['mpesa_active_days'], grouped['day'].nunique())
+        np.testing.assert_allclose(features['mpesa_days_since_last'], recency)
+        np.testing.assert_allclose(features['mpesa_median_transaction'], grouped['size'].median(), rtol=0.02)
+        
+        # Recency from an explicit date a day after the latest transaction
+        as_of = log['timestamp'].max() + pd.Timedelta(days=1)
+        shifted = MpesaAggregator().aggregate(self.log).features(as_of=as_of).set_index('applicant_id')
+        np.testing.assert_allclose(shifted.loc[features.index, 'mpesa_days_since_last'], recency + 1)
+    
+    def test_join_feeds_data_cleaner(self):
+        """Test that joined features fill applicants without statements and clean directly"""
+        applications = pd.DataFrame({
+            'applicant_id': ['APP_00001', 'APP_00002', 'APP_99999'],
+            'age': [30.0, 45.0, 52.0],
+            'location': ['Nairobi', 'Kisumu', 'Nairobi'],
+            'loan_amount': [20000.0, 50000.0, 10000.0],
+            'income': [30000.0, 60000.0, 15000.0]
+        })
+        
+        joined = MpesaAggregator(period_days=90).aggregate(self.log).join(applications)
+        cleaned = DataCleaner().clean_credit_data(joined)
+        
+        self.assertEqual(joined['mpesa_transaction_count'].iloc[2], 0)
+        self.assertEqual(joined['mpesa_active_days'].iloc[2], 0)
+        expected_rate = (self.log['applicant_id'] == 'APP_00001').sum() * 30 / 90
+        self.assertAlmostEqual(joined['mpesa_transaction_count'].iloc[0], expected_rate)
+        self.assertFalse(cleaned['mpesa_median_transaction'].isnull().any())
+        self.assertIn('financial_activity_score', cleaned.columns)
+    
+    def test_join_replaces_precomputed_columns(self):
+        """Test that stale M-Pesa columns in the applications give way to the aggregated ones"""
+        applications = pd.DataFrame({
+            'applicant_id': ['APP_00001', 'APP_99999'],
+            'mpesa_transaction_count': [np.nan, 12.0]
+        })
+        
+        with self.assertLogs('data_processing.mpesa_aggregator', level='WARNING'):
+            joined = MpesaAggregator().aggregate(self.log).join(applications)
+        
+        expected_count = (self.log['applicant_id'] == 'APP_00001').sum()
+        self.assertEqual(joined['mpesa_transaction_count'].tolist(), [expected_count, 0])
+        self.assertEqual(list(joined.columns).count('mpesa_transaction_count'), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import numpy as np
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data_processing.sketches import HyperLogLog, KLLSketch
+
+class TestKLLSketch(unittest.TestCase):
+    
+    def setUp(self):
+        """Skewed values like loan amounts"""
+        self.values = np.random.default_rng(42).lognormal(10, 1, 200000)
+    
+    def test_exact_below_limit(self):
+        """Test that small inputs give the exact median"""
+        sketch = KLLSketch(exact_limit=1000).update(self.values[:999])
+        
+        self.assertTrue(sketch.is_exact)
+        self.assertEqual(sketch.median(), np.median(self.values[:999]))
+    
+    def test_merged_chunks_bound_rank_error(self):
+        """Test that sketches merged across chunks keep quantiles within rank error"""
+        sketches = [KLLSketch().update(chunk) for chunk in np.array_split(self.values, 10)]
+        merged = sketches[0]
+        for sketch in sketches[1:]:
+            merged = merged.merge(sketch)
+        
+        self.assertEqual(merged.n, len(self.values))
+        for q in (0.1, 0.5, 0.9):
+            rank = (self.values < merged.quantile(q)).mean()
+            self.assertLess(abs(rank - q), 0.02)
+
+class TestHyperLogLog(unittest.TestCase):
+    
+    def test_merged_distinct_count_within_error(self):
+        """Test that merged chunk sketches estimate the distinct count of the union"""
+        values = np.random.default_rng(0).integers(0, 100000, 300000).astype(float)
+        sketches = [HyperLogLog().update(chunk) for chunk in np.array_split(values, 6)]
+        merged = sketches[0]
+        for sketch in sketches[1:]:
+            merged = merged.merge(sketch)
+        
+        distinct = len(np.unique(values))
+        self.assertLess(abs(merged.count() - distinct) / distinct, 0.05)
+    
+    def test_small_cardinality_ignores_nulls(self):
+        """Test that a handful of labels is counted exactly and nulls are skipped"""
+        sketch = HyperLogLog().update(np.array(['Nairobi', 'Kisumu', None, 'Nairobi', np.nan], dtype=object))
+        
+        self.assertEqual(sketch.count(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
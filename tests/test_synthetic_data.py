@@ -3,11 +3,13 @@ import pandas as pd
 import numpy as np
 import sys
 import os
+import tempfile
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from synthetic_generator.fair_gan import FairDataGenerator
 from synthetic_generator.data_validator import DataValidator
+from synthetic_generator.model_cache import ModelCache
 
 class TestSyntheticData(unittest.TestCase):
     
@@ -38,6 +40,100 @@ class TestSyntheticData(unittest.TestCase):
         self.assertEqual(len(synthetic_data), 50)
         self.assertEqual(synthetic_data.shape[1], self.sample_data.shape[1])
     
+    def test_fit_reuses_cached_model(self):
+        """Test that refitting on the same data and settings skips training"""
+        cache = ModelCache()
+        model = FairDataGenerator(epochs=10, cache=cache).fit(self.sample_data).model
+        
+        refit = FairDataGenerator(epochs=10, cache=cache).fit(self.sample_data)
+        
+        self.assertIs(refit.model, model)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(refit.sample(20)), 20)
+    
+    def test_model_fingerprint_covers_data_and_params(self):
+        """Test that cache keys change with the training data or hyperparameters"""
+        params = {'model': 'ctgan', 'epochs': 10, 'batch_size': 500}
+        key = ModelCache.fingerprint(self.sample_data, params)
+        
+        self.assertEqual(key, ModelCache.fingerprint(self.sample_data.copy(), dict(params)))
+        self.assertNotEqual(key, ModelCache.fingerprint(self.sample_data, dict(params, epochs=20)))
+        self.assertNotEqual(key, ModelCache.fingerprint(self.sample_data.head(99), params))
+    
+    def test_model_cache_evicts_disk_tier(self):
+        """Test that pickled models beyond the disk budget are evicted oldest first"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = ModelCache(max_entries=1, cache_dir=tmp_dir, max_disk_bytes=25000)
+            for i, key in enumerate(['a', 'b', 'c']):
+                cache.put(key, np.zeros(1000))  # ~8 KB pickled
+                os.utime(os.path.join(tmp_dir, f"{key}.pkl"), (i, i))
+            cache.put('d', np.zeros(1000))
+            
+            self.assertEqual(sorted(os.listdir(tmp_dir)), ['b.pkl', 'c.pkl', 'd.pkl'])
+            self.assertIsNone(cache.get('a'))
+            self.assertIsNotNone(ModelCache(cache_dir=tmp_dir).get('b'))
+    
+    def test_save_and_load_round_trip(self):
+        """Test that a saved generator samples without retraining"""
+        self.generator.fit(self.sample_data)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'generator.pkl')
+            self.generator.save(path)
+            restored = FairDataGenerator.load(path)
+        
+        self.assertEqual(restored.model_key, self.generator.model_key)
+        self.assertEqual(list(restored.sample(30).columns), list(self.sample_data.columns))
+    
+    def test_sample_to_files_streams_batches(self):
+        """Test that large requests are written batch by batch to partitioned files"""
+        self.generator.fit(self.sample_data)
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            summary = self.generator.sample_to_files(250, tmp_dir, batch_size=100, fair_columns=['gender'],
+                                                     partition_cols=['location'])
+            written = pd.read_parquet(tmp_dir)
+        
+        self.assertEqual(summary['batches'], 3)
+        self.assertEqual(summary['rows'], 250)
+        self.assertEqual(len(written), 250)
+        self.assertEqual(set(written.columns), set(self.sample_data.columns))
+    
+    def test_sharded_sampling_is_reproducible(self):
+        """Test that seeded shards reproduce the same rows for a given worker count"""
+        generator = FairDataGenerator(epochs=10, random_state=7).fit(self.sample_data)
+        
+        first = generator.sample_parallel(120, max_workers=2, batch_size=50)
+        second = generator.sample_parallel(120, max_workers=2, batch_size=50)
+        
+        self.assertEqual(len(first), 120)
+        pd.testing.assert_frame_equal(first, second)
+    
+    def test_joint_balancing_modes(self):
+        """Test that every location x gender cell reaches the same count in each mode"""
+        expected_sizes = {'fixed': 100, 'over': 4 * self.sample_data.groupby(['location', 'gender']).size().max(),
+                          'under': 4 * self.sample_data.groupby(['location', 'gender']).size().min()}
+        
+        for mode, expected_size in expected_sizes.items():
+            generator = FairDataGenerator(balance_mode=mode, random_state=0)
+            balanced = generator._balance_protected_attributes(self.sample_data, ['location', 'gender'])
+            
+            cell_sizes = balanced.groupby(['location', 'gender']).size()
+            self.assertEqual(len(balanced), expected_size)
+            self.assertLessEqual(cell_sizes.max() - cell_sizes.min(), 1)
+    
+    def test_sample_quotas_fills_each_cell(self):
+        """Test that quota sampling returns exactly the requested rows per protected cell"""
+        self.generator.fit(self.sample_data)
+        quotas = [{'location': 1, 'gender': 1, 'num_rows': 20}, {'location': 0, 'gender': 0, 'num_rows': 10}]
+        
+        synthetic_data = self.generator.sample_quotas(quotas)
+        
+        cell_sizes = synthetic_data.groupby(['location', 'gender']).size()
+        self.assertEqual(cell_sizes.loc[(1, 1)], 20)
+        self.assertEqual(cell_sizes.loc[(0, 0)], 10)
+        self.assertEqual(len(synthetic_data), 30)
+    
     def test_data_validation(self):
         """Test data validation functionality"""
         synthetic_data = self.generator.generate_fair_data(self.sample_data, num_samples=100)